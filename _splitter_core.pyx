@@ -0,0 +1,30 @@
+# cython: language_level=3
+"""
+Optional compiled core for the splitter hot loop. Build with:
+
+    cythonize -i _splitter_core.pyx
+
+splitters.py falls back to an equivalent pure-Python implementation when
+this extension has not been built.
+"""
+from collections import ChainMap
+
+# Safe circular import: splitters defines LightDoc before it tries to
+# import this extension.
+from splitters import LightDoc
+
+
+cpdef list build_documents(list chunks, object base):
+    """
+    Materialize chunked LightDocs from a list of chunk strings and a shared
+    base metadata mapping. Pre-sizes the result and assigns by index so the
+    loop runs without list-growth reallocation or Python-level append calls.
+    """
+    cdef Py_ssize_t i, n = len(chunks)
+    cdef list docs = [None] * n
+    for i in range(n):
+        docs[i] = LightDoc(
+            page_content=chunks[i],
+            metadata=ChainMap({"chunkno": i + 1}, base)
+        )
+    return docs
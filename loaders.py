@@ -1,359 +1,762 @@
-from langchain_community.document_loaders import (
-    TextLoader, CSVLoader, BSHTMLLoader, JSONLoader, 
-    PyPDFLoader, PyMuPDFLoader, UnstructuredPDFLoader, 
-    OnlinePDFLoader, PyPDFium2Loader, PDFMinerLoader, 
-    PyPDFDirectoryLoader, PDFPlumberLoader, CSVLoader as LangCSVLoader, WebBaseLoader
-)
-from pathlib import Path
-from pprint import pprint
-
-class LangChainLoader:
-    """
-    A class to handle loading and processing documents from various sources, 
-    such as text files, CSV files, PDFs, JSON, HTML, and web URLs.
-    """
-
-    def __init__(self):
-        """
-        Initializes the LangChainLoader class with default attributes.
-        Attributes:
-            file_path (str): Path to the file to be loaded (default: None).
-            url (str): URL of the web resource to be fetched (default: None).
-        """
-        self.file_path = None  # Attribute to store file path
-        self.url = None        # Attribute to store URL for web-based loading
-
-    def load_as_textfile(self, file_path):
-        """
-        Load a text file and return its content as a list of Document objects.
-        
-        Args:
-            file_path (str): Path to the text file to be loaded.
-        
-        Returns:
-            list: A list of Document objects containing the file content.
-        
-        Raises:
-            FileNotFoundError: If the specified file does not exist.
-            Exception: For any other issues during file loading.
-        """
-        try:
-            loader = TextLoader(file_path)  # Instantiate a TextLoader for the given file
-            documents = loader.load()      # Load the file and extract documents
-            return documents
-        except FileNotFoundError as fnf_error:
-            print(f"Error: The file '{self.file_path}' was not found.")
-            raise fnf_error  # Re-raise the exception for higher-level handling
-        except Exception as e:
-            print(f"An error occurred while loading the text file: {e}")
-            raise
-
-    def load_as_csv(self, file_path):
-        """
-        Load a CSV file and return its content as a list of Document objects.
-        
-        Args:
-            file_path (str): Path to the CSV file to be loaded.
-        
-        Returns:
-            list: A list of Document objects containing the CSV content.
-        
-        Raises:
-            FileNotFoundError: If the file does not exist.
-            Exception: For other issues during loading.
-        """
-        try:
-            loader = CSVLoader(
-                file_path=file_path,
-                csv_args={'delimiter': ',', 'quotechar': '"'}  # Specify CSV parsing arguments
-            )
-            documents = loader.load()
-            return documents
-        except FileNotFoundError as fnf_error:
-            print(f"Error: The file '{self.file_path}' was not found.")
-            raise fnf_error
-        except Exception as e:
-            print(f"An error occurred while loading the CSV file: {e}")
-            raise
-
-    def load_as_csv_with_source_column(self, file_path, source_column: str) -> list:
-        """
-        Load a CSV file with a specific source column and return its content as a list of Document objects.
-        
-        Args:
-            file_path (str): Path to the CSV file.
-            source_column (str): Column in the CSV file to be used as the source.
-        
-        Returns:
-            list: A list of Document objects filtered by the source column.
-        
-        Raises:
-            FileNotFoundError: If the file is not found.
-            Exception: For other issues during loading.
-        """
-        try:
-            loader = LangCSVLoader(file_path=file_path, source_column=source_column)
-            documents = loader.load()
-            return documents
-        except FileNotFoundError as fnf_error:
-            print(f"Error: {fnf_error}")
-            raise
-        except Exception as e:
-            print(f"An error occurred while loading the CSV file with source column: {e}")
-            raise
-
-    def load_as_html(self, file_path):
-        """
-        Load an HTML file and return its content as a list of Document objects.
-        
-        Args:
-            file_path (str): Path to the HTML file.
-        
-        Returns:
-            list: A list of Document objects containing the HTML content.
-        
-        Raises:
-            FileNotFoundError: If the file is not found.
-            Exception: For other issues during loading.
-        """
-        try:
-            loader = BSHTMLLoader(file_path)  # Use BSHTMLLoader for HTML parsing
-            documents = loader.load()
-            return documents
-        except FileNotFoundError as fnf_error:
-            print(f"Error: The file '{self.file_path}' was not found.")
-            raise fnf_error
-        except Exception as e:
-            print(f"An error occurred while loading the HTML file: {e}")
-            raise
-
-    def load_as_json(self, file_path):
-        """
-        Load a JSON file and return its content as a list of Document objects.
-        
-        Args:
-            file_path (str): Path to the JSON file.
-        
-        Returns:
-            list: A list of Document objects parsed from the JSON file.
-        
-        Raises:
-            FileNotFoundError: If the file does not exist.
-            Exception: For any other issues during loading.
-        """
-        try:
-            loader = JSONLoader(
-                file_path=file_path,
-                jq_schema='.messages[].content',  # Schema to filter content from JSON
-                text_content=False
-            )
-            documents = loader.load()
-            return documents
-        except FileNotFoundError as fnf_error:
-            print(f"Error: The file '{self.file_path}' was not found.")
-            raise fnf_error
-        except Exception as e:
-            print(f"An error occurred while loading the JSON file: {e}")
-            raise
-
-    def load_as_pdf(self, file_path):
-        """
-        Load and split a PDF file into smaller chunks using PyPDFLoader.
-        
-        Args:
-            file_path (str): Path to the PDF file.
-        
-        Returns:
-            list: A list of Document objects containing chunks of the PDF content.
-        
-        Raises:
-            FileNotFoundError: If the file does not exist.
-            Exception: For other issues during loading.
-        """
-        try:
-            loader = PyPDFLoader(file_path)
-            documents = loader.load_and_split()
-            return documents
-        except FileNotFoundError as fnf_error:
-            print(f"Error: The file '{self.file_path}' was not found.")
-            raise fnf_error
-        except Exception as e:
-            print(f"An error occurred while loading the PDF file: {e}")
-            raise
-
-    def load_with_pymupdf(self, file_path):
-        """
-        Load a PDF file using PyMuPDFLoader.
-        
-        Parameters:
-        - file_path (str): Path to the PDF file to load.
-        
-        Returns:
-        - list: A list of Document objects containing the PDF content.
-        
-        Raises:
-        - Exception: If an error occurs during the loading process.
-        """
-        try:
-            # Initialize PyMuPDFLoader and load the PDF file
-            loader = PyMuPDFLoader(file_path)
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while loading the PDF with PyMuPDFLoader: {e}")
-            raise
-
-    def load_with_unstructuredpdf(self, file_path):
-        """
-        Load a PDF file using UnstructuredPDFLoader.
-        
-        Parameters:
-        - file_path (str): Path to the PDF file to load.
-        
-        Returns:
-        - list: A list of Document objects containing the PDF content.
-        
-        Raises:
-        - Exception: If an error occurs during the loading process.
-        """
-        try:
-            # Initialize UnstructuredPDFLoader and load the PDF file
-            loader = UnstructuredPDFLoader(file_path)
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while loading the PDF with UnstructuredPDFLoader: {e}")
-            raise
-
-    def load_with_pypdfium2(self, file_path):
-        """
-        Load a PDF file using PyPDFium2Loader.
-        
-        Parameters:
-        - file_path (str): Path to the PDF file to load.
-        
-        Returns:
-        - list: A list of Document objects containing the PDF content.
-        
-        Raises:
-        - Exception: If an error occurs during the loading process.
-        """
-        try:
-            # Initialize PyPDFium2Loader and load the PDF file
-            loader = PyPDFium2Loader(file_path)
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while loading the PDF with PyPDFium2Loader: {e}")
-            raise
-
-    def load_with_pdfminer(self, file_path):
-        """
-        Load a PDF file using PDFMinerLoader.
-        
-        Parameters:
-        - file_path (str): Path to the PDF file to load.
-        
-        Returns:
-        - list: A list of Document objects containing the PDF content.
-        
-        Raises:
-        - Exception: If an error occurs during the loading process.
-        """
-        try:
-            # Initialize PDFMinerLoader and load the PDF file
-            loader = PDFMinerLoader(file_path)
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while loading the PDF with PDFMinerLoader: {e}")
-            raise
-
-    def load_directory_pdfs(self, directory_path):
-        """
-        Load all PDF files in a directory using PyPDFDirectoryLoader.
-        
-        Parameters:
-        - directory_path (str): Path to the directory containing PDF files.
-        
-        Returns:
-        - list: A list of Document objects containing the PDFs' content.
-        
-        Raises:
-        - Exception: If an error occurs during the loading process.
-        """
-        try:
-            # Initialize PyPDFDirectoryLoader and load all PDFs in the directory
-            loader = PyPDFDirectoryLoader(directory_path)
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while loading PDFs from directory: {e}")
-            raise
-
-    def load_with_pdfplumber(self, file_path):
-        """
-        Load a PDF file using PDFPlumberLoader.
-        
-        Parameters:
-        - file_path (str): Path to the PDF file to load.
-        
-        Returns:
-        - list: A list of Document objects containing the PDF content.
-        
-        Raises:
-        - Exception: If an error occurs during the loading process.
-        """
-        try:
-            # Initialize PDFPlumberLoader and load the PDF file
-            loader = PDFPlumberLoader(file_path)
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while loading the PDF with PDFPlumberLoader: {e}")
-            raise
-
-    def load_online_pdf(self, url):
-        """
-        Load an online PDF from the given URL using OnlinePDFLoader.
-        
-        Parameters:
-        - url (str): The URL of the online PDF to load.
-        
-        Returns:
-        - list: A list of Document objects containing the PDF content.
-        
-        Raises:
-        - Exception: If an error occurs during the loading process.
-        """
-        try:
-            # Initialize OnlinePDFLoader and load the PDF content from the URL
-            loader = OnlinePDFLoader(url)
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while loading the online PDF: {e}")
-            raise
-
-    def fetch_data_from_url(self, url):
-        """
-        Fetch data from a web URL using WebBaseLoader.
-        
-        Parameters:
-        - url (str): The web URL to fetch data from.
-        
-        Returns:
-        - list: A list of Document objects containing the web data.
-        
-        Raises:
-        - Exception: If an error occurs during the fetching process.
-        """
-        try:
-            # Initialize WebBaseLoader and fetch data from the URL
-            loader = WebBaseLoader(web_paths=[url])
-            documents = loader.load()
-            return documents
-        except Exception as e:
-            print(f"An error occurred while fetching data from the URL: {e}")
-            raise
-
+from langchain.schema import Document
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from pprint import pprint
+import asyncio
+import logging
+import mmap
+import os
+
+logger = logging.getLogger(__name__)
+
+# The individual loaders (and fitz/aiohttp/pyarrow) are imported inside the
+# methods that use them: each one drags in large transitive dependencies
+# (pdfminer, unstructured, BeautifulSoup, ...), and a process that only loads
+# one file type shouldn't pay the import cost of all of them at startup.
+# Python caches imports in sys.modules, so repeat calls only do a dict lookup.
+
+def _extract_pages_text(file_path, page_numbers):
+    """
+    Worker for parallel PDF page extraction. Reopens the PDF in the child
+    process (fitz.Document is not picklable) and returns the plain text of
+    the requested pages.
+
+    Parameters:
+    - file_path (str): Path to the PDF file.
+    - page_numbers (list): Page indices this worker should extract.
+
+    Returns:
+    - list: (page_number, text) tuples for the requested pages.
+    """
+    import fitz
+    doc = fitz.open(file_path)
+    try:
+        return [(page_number, doc[page_number].get_text("text")) for page_number in page_numbers]
+    finally:
+        doc.close()
+
+def _load_one_pdf(file_path):
+    """
+    Worker for parallel directory loading. Defined at module level so it is
+    picklable by ProcessPoolExecutor.
+
+    Parameters:
+    - file_path (str or Path): Path to the PDF file to load.
+
+    Returns:
+    - list: A list of Document objects containing the PDF content.
+    """
+    from langchain_community.document_loaders import PyMuPDFLoader
+    return PyMuPDFLoader(str(file_path)).load()
+
+class LangChainLoader:
+    """
+    A class to handle loading and processing documents from various sources, 
+    such as text files, CSV files, PDFs, JSON, HTML, and web URLs.
+    """
+
+    def __init__(self):
+        """
+        Initializes the LangChainLoader class with default attributes.
+        Attributes:
+            file_path (str): Path to the file to be loaded (default: None).
+            url (str): URL of the web resource to be fetched (default: None).
+        """
+        self.file_path = None  # Attribute to store file path
+        self.url = None        # Attribute to store URL for web-based loading
+        self._pdf_cache = {}   # Parsed fitz documents: file_path -> (mtime, document)
+        self._http = None      # Pooled requests.Session, created on first web fetch
+
+    def _http_session(self):
+        """
+        Returns a shared requests.Session with a widened connection pool.
+        Reusing one session keeps connections alive across fetches, so only
+        the first request to a host pays the TCP+TLS handshake.
+
+        Returns:
+            requests.Session: The pooled session.
+        """
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._http = session
+        return self._http
+
+    def load_as_textfile(self, file_path, fast=True):
+        """
+        Load a text file and return its content as a list of Document objects.
+        The default fast path mmaps the file and decodes it once, avoiding
+        TextLoader's extra buffer copy; fast=False keeps the old loader.
+
+        Args:
+            file_path (str): Path to the text file to be loaded.
+            fast (bool): If True, read via mmap instead of TextLoader.
+
+        Returns:
+            list: A list of Document objects containing the file content.
+        
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            Exception: For any other issues during file loading.
+        """
+        try:
+            if fast:
+                # mmap keeps the file backing in the page cache; the only
+                # user-space copy is the decoded str itself.
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:  # mmap rejects empty files
+                        text = ""
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            text = mm[:].decode('utf-8', errors='replace')
+                return [Document(page_content=text, metadata={"source": file_path})]
+            from langchain_community.document_loaders import TextLoader
+            loader = TextLoader(file_path)  # Instantiate a TextLoader for the given file
+            documents = loader.load()      # Load the file and extract documents
+            return documents
+        except FileNotFoundError as fnf_error:
+            logger.exception("File not found: %s", file_path)
+            raise fnf_error  # Re-raise the exception for higher-level handling
+        except Exception:
+            logger.exception("Failed to load text file %s", file_path)
+            raise
+
+    def iter_textfile_chunks(self, file_path, chunk_bytes=1 << 20):
+        """
+        Stream a large text file as Documents of roughly chunk_bytes each,
+        split at newline boundaries. Slicing the mmap avoids ever building
+        one giant string, so peak memory stays at one chunk regardless of
+        file size.
+
+        Args:
+            file_path (str): Path to the text file to be streamed.
+            chunk_bytes (int): Approximate chunk size in bytes (default 1 MiB).
+
+        Yields:
+            Document: One Document per chunk, in file order.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            Exception: For any other issues during file loading.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:  # mmap rejects empty files
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                size = len(mm)
+                while start < size:
+                    end = min(start + chunk_bytes, size)
+                    if end < size:
+                        newline = mm.find(b'\n', end)  # Extend to the next line break
+                        end = size if newline == -1 else newline + 1
+                    yield Document(
+                        page_content=mm[start:end].decode('utf-8', errors='replace'),
+                        metadata={"source": file_path, "offset": start}
+                    )
+                    start = end
+
+    def load_as_csv(self, file_path, use_langchain=False):
+        """
+        Load a CSV file and return its content as a list of Document objects.
+        Parsing is done with pyarrow's multi-threaded C++ CSV reader instead
+        of Python's row-by-row csv module; the old CSVLoader path is still
+        available via use_langchain=True.
+
+        Args:
+            file_path (str): Path to the CSV file to be loaded.
+            use_langchain (bool): If True, fall back to the old CSVLoader path.
+
+        Returns:
+            list: A list of Document objects containing the CSV content.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: For other issues during loading.
+        """
+        try:
+            if use_langchain:
+                from langchain_community.document_loaders import CSVLoader
+                loader = CSVLoader(
+                    file_path=file_path,
+                    csv_args={'delimiter': ',', 'quotechar': '"'}  # Specify CSV parsing arguments
+                )
+                documents = loader.load()
+                return documents
+            import pyarrow.csv as pacsv
+            table = pacsv.read_csv(
+                file_path,
+                parse_options=pacsv.ParseOptions(delimiter=',', quote_char='"')
+            )
+            columns = table.column_names
+            documents = [
+                Document(
+                    page_content="\n".join(f"{column}: {row[column]}" for column in columns),
+                    metadata={"source": file_path, "row": row_index}
+                )
+                for row_index, row in enumerate(table.to_pylist())
+            ]
+            return documents
+        except FileNotFoundError as fnf_error:
+            logger.exception("File not found: %s", file_path)
+            raise fnf_error
+        except Exception:
+            logger.exception("Failed to load CSV file %s", file_path)
+            raise
+
+    def load_as_csv_with_source_column(self, file_path, source_column: str) -> list:
+        """
+        Load a CSV file with a specific source column and return its content as a list of Document objects.
+        
+        Args:
+            file_path (str): Path to the CSV file.
+            source_column (str): Column in the CSV file to be used as the source.
+        
+        Returns:
+            list: A list of Document objects filtered by the source column.
+        
+        Raises:
+            FileNotFoundError: If the file is not found.
+            Exception: For other issues during loading.
+        """
+        try:
+            from langchain_community.document_loaders import CSVLoader as LangCSVLoader
+            loader = LangCSVLoader(file_path=file_path, source_column=source_column)
+            documents = loader.load()
+            return documents
+        except FileNotFoundError as fnf_error:
+            logger.exception("File not found: %s", file_path)
+            raise
+        except Exception:
+            logger.exception("Failed to load CSV file %s with source column %s", file_path, source_column)
+            raise
+
+    def load_as_html(self, file_path):
+        """
+        Load an HTML file and return its content as a list of Document objects.
+        
+        Args:
+            file_path (str): Path to the HTML file.
+        
+        Returns:
+            list: A list of Document objects containing the HTML content.
+        
+        Raises:
+            FileNotFoundError: If the file is not found.
+            Exception: For other issues during loading.
+        """
+        try:
+            from langchain_community.document_loaders import BSHTMLLoader
+            loader = BSHTMLLoader(file_path)  # Use BSHTMLLoader for HTML parsing
+            documents = loader.load()
+            return documents
+        except FileNotFoundError as fnf_error:
+            logger.exception("File not found: %s", file_path)
+            raise fnf_error
+        except Exception:
+            logger.exception("Failed to load HTML file %s", file_path)
+            raise
+
+    def load_as_html_fast(self, file_path):
+        """
+        Load an HTML file using selectolax (C Lexbor engine). Parsing and
+        text extraction stay in C with minimal per-node Python objects,
+        typically several times faster than the BeautifulSoup-based
+        load_as_html for plain text extraction.
+
+        Args:
+            file_path (str): Path to the HTML file.
+
+        Returns:
+            list: A single-element list with a Document holding the page text.
+
+        Raises:
+            FileNotFoundError: If the file is not found.
+            Exception: For other issues during loading.
+        """
+        try:
+            from selectolax.parser import HTMLParser
+            with open(file_path, 'rb') as f:
+                tree = HTMLParser(f.read())
+            text = tree.body.text(separator='\n') if tree.body else ""
+            title_node = tree.css_first('title')
+            documents = [
+                Document(
+                    page_content=text,
+                    metadata={"source": file_path, "title": title_node.text() if title_node else ""}
+                )
+            ]
+            return documents
+        except FileNotFoundError as fnf_error:
+            logger.exception("File not found: %s", file_path)
+            raise fnf_error
+        except Exception:
+            logger.exception("Failed to load HTML file %s", file_path)
+            raise
+
+    def load_as_json(self, file_path, jq_schema='.messages[].content'):
+        """
+        Load a JSON file and return its content as a list of Document objects.
+        The default schema ('.messages[].content') is handled directly with
+        orjson (SIMD-accelerated C parsing) instead of spinning up a jq
+        program per call; any other schema falls back to JSONLoader.
+
+        Args:
+            file_path (str): Path to the JSON file.
+            jq_schema (str): jq expression selecting the content to extract.
+
+        Returns:
+            list: A list of Document objects parsed from the JSON file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: For any other issues during loading.
+        """
+        try:
+            if jq_schema == '.messages[].content':
+                try:
+                    from orjson import loads as json_loads
+                except ImportError:  # orjson is optional; stdlib json parses bytes too
+                    from json import loads as json_loads
+                with open(file_path, 'rb') as f:
+                    data = json_loads(f.read())
+                documents = [
+                    Document(page_content=message["content"], metadata={"source": file_path, "seq_num": idx + 1})
+                    for idx, message in enumerate(data["messages"])
+                ]
+                return documents
+            # Non-default schema: keep the jq-based loader
+            from langchain_community.document_loaders import JSONLoader
+            loader = JSONLoader(
+                file_path=file_path,
+                jq_schema=jq_schema,  # Schema to filter content from JSON
+                text_content=False
+            )
+            documents = loader.load()
+            return documents
+        except FileNotFoundError as fnf_error:
+            logger.exception("File not found: %s", file_path)
+            raise fnf_error
+        except Exception:
+            logger.exception("Failed to load JSON file %s", file_path)
+            raise
+
+    def _open_pdf(self, file_path):
+        """
+        Open a PDF with fitz, caching the parsed document per path so
+        repeated calls don't re-parse the xref table. A changed mtime
+        closes and replaces the stale entry, so edited files never leak an
+        open document or its file descriptor.
+
+        Args:
+            file_path (str): Path to the PDF file.
+
+        Returns:
+            fitz.Document: The parsed PDF document.
+        """
+        import fitz
+        mtime = os.path.getmtime(file_path)
+        cached = self._pdf_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if cached is not None:
+            cached[1].close()  # File changed on disk: release the stale handle
+        document = fitz.open(file_path)
+        self._pdf_cache[file_path] = (mtime, document)
+        return document
+
+    def iter_pdf_pages(self, file_path):
+        """
+        Stream a PDF one Document per page instead of materializing the
+        whole file. Peak memory stays at roughly one page, and downstream
+        chunking/embedding can start before parsing finishes (e.g. consume
+        in windows with itertools.islice).
+
+        Args:
+            file_path (str): Path to the PDF file.
+
+        Yields:
+            Document: One Document per page, in page order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: For other issues during loading.
+        """
+        import fitz
+        pdf = fitz.open(file_path)
+        try:
+            for page_number in range(pdf.page_count):
+                yield Document(
+                    page_content=pdf[page_number].get_text("text"),
+                    metadata={"source": file_path, "page": page_number}
+                )
+        finally:
+            pdf.close()
+
+    def load_as_pdf(self, file_path, use_pypdf=False, parallel_page_threshold=50, as_iterator=False):
+        """
+        Load a PDF file into per-page Document objects using PyMuPDF.
+        PyMuPDF parses in native C and is much faster than the pure-Python
+        PyPDFLoader; the old behavior is still available via use_pypdf=True.
+        Large PDFs bypass the LangChain wrapper and extract pages in parallel
+        across a process pool.
+
+        Args:
+            file_path (str): Path to the PDF file.
+            use_pypdf (bool): If True, fall back to the old PyPDFLoader path.
+            parallel_page_threshold (int): Page count above which pages are
+                extracted in parallel with a process pool.
+            as_iterator (bool): If True, return a generator that streams one
+                Document per page instead of a list.
+
+        Returns:
+            list: A list of Document objects containing the PDF content, or
+            a generator of Documents when as_iterator=True.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: For other issues during loading.
+        """
+        try:
+            if as_iterator:
+                return self.iter_pdf_pages(file_path)
+            if use_pypdf:
+                from langchain_community.document_loaders import PyPDFLoader
+                loader = PyPDFLoader(file_path)
+                documents = loader.load_and_split()
+                return documents
+            pdf = self._open_pdf(file_path)
+            page_count = pdf.page_count
+            if page_count <= parallel_page_threshold:
+                from langchain_community.document_loaders import PyMuPDFLoader
+                loader = PyMuPDFLoader(file_path)
+                documents = loader.load()
+                return documents
+            # Large PDF: farm page extraction out across all cores.
+            workers = min(os.cpu_count() or 1, page_count)
+            slices = [list(range(i, page_count, workers)) for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_extract_pages_text, [file_path] * workers, slices)
+            pages = sorted(pair for result in results for pair in result)
+            documents = [
+                Document(
+                    page_content=text,
+                    metadata={"source": file_path, "page": page_number}
+                )
+                for page_number, text in pages
+            ]
+            return documents
+        except FileNotFoundError as fnf_error:
+            logger.exception("File not found: %s", file_path)
+            raise fnf_error
+        except Exception:
+            logger.exception("Failed to load PDF file %s", file_path)
+            raise
+
+    # Registry of PDF backends: one data table instead of ten near-identical
+    # methods. Values are attribute names on langchain_community.document_loaders
+    # so only the chosen backend is actually imported.
+    _PDF_BACKENDS = {
+        "pymupdf": "PyMuPDFLoader",
+        "pypdf": "PyPDFLoader",
+        "pdfium2": "PyPDFium2Loader",
+        "pdfminer": "PDFMinerLoader",
+        "pdfplumber": "PDFPlumberLoader",
+        "unstructured": "UnstructuredPDFLoader",
+    }
+
+    def load_pdf(self, file_path, backend="pymupdf"):
+        """
+        Load a PDF file with the named backend via a dict-lookup registry.
+
+        Parameters:
+        - file_path (str): Path to the PDF file to load.
+        - backend (str): One of _PDF_BACKENDS (default: "pymupdf").
+
+        Returns:
+        - list: A list of Document objects containing the PDF content.
+
+        Raises:
+        - KeyError: If the backend name is unknown.
+        - Exception: If an error occurs during the loading process.
+        """
+        try:
+            import langchain_community.document_loaders as document_loaders
+            loader_cls = getattr(document_loaders, self._PDF_BACKENDS[backend])
+            documents = loader_cls(file_path).load()
+            return documents
+        except KeyError:
+            logger.error("Unknown PDF backend '%s'. Choose from: %s", backend, sorted(self._PDF_BACKENDS))
+            raise
+        except Exception:
+            logger.exception("Failed to load PDF %s with backend '%s'", file_path, backend)
+            raise
+
+    def load_with_pymupdf(self, file_path):
+        """
+        Load a PDF file using PyMuPDFLoader. Shim around load_pdf kept for
+        API compatibility.
+
+        Parameters:
+        - file_path (str): Path to the PDF file to load.
+
+        Returns:
+        - list: A list of Document objects containing the PDF content.
+        """
+        return self.load_pdf(file_path, backend="pymupdf")
+
+    def load_with_unstructuredpdf(self, file_path):
+        """
+        Load a PDF file using UnstructuredPDFLoader. Shim around load_pdf
+        kept for API compatibility.
+
+        Parameters:
+        - file_path (str): Path to the PDF file to load.
+
+        Returns:
+        - list: A list of Document objects containing the PDF content.
+        """
+        return self.load_pdf(file_path, backend="unstructured")
+
+    def load_with_pypdfium2(self, file_path):
+        """
+        Load a PDF file using PyPDFium2Loader. Shim around load_pdf kept for
+        API compatibility.
+
+        Parameters:
+        - file_path (str): Path to the PDF file to load.
+
+        Returns:
+        - list: A list of Document objects containing the PDF content.
+        """
+        return self.load_pdf(file_path, backend="pdfium2")
+
+    def load_with_pdfminer(self, file_path):
+        """
+        Load a PDF file using PDFMinerLoader. Shim around load_pdf kept for
+        API compatibility.
+
+        Parameters:
+        - file_path (str): Path to the PDF file to load.
+
+        Returns:
+        - list: A list of Document objects containing the PDF content.
+        """
+        return self.load_pdf(file_path, backend="pdfminer")
+
+    def load_directory_pdfs(self, directory_path, max_workers=None):
+        """
+        Load all PDF files in a directory, parsing them in parallel across a
+        process pool. PDF parsing is CPU-bound and independent per file, so
+        this scales nearly linearly with cores instead of walking the
+        directory serially like PyPDFDirectoryLoader.
+
+        Parameters:
+        - directory_path (str): Path to the directory containing PDF files.
+        - max_workers (int): Number of worker processes (default: all cores).
+
+        Returns:
+        - list: A list of Document objects containing the PDFs' content.
+
+        Raises:
+        - Exception: If an error occurs during the loading process.
+        """
+        try:
+            paths = sorted(Path(directory_path).rglob("*.pdf"))
+            if not paths:
+                return []
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                results = list(executor.map(_load_one_pdf, paths, chunksize=4))
+            # Flatten the per-file lists into one list of Documents
+            documents = [document for result in results for document in result]
+            return documents
+        except Exception:
+            logger.exception("Failed to load PDFs from directory %s", directory_path)
+            raise
+
+    def load_with_pdfplumber(self, file_path):
+        """
+        Load a PDF file using PDFPlumberLoader. Shim around load_pdf kept
+        for API compatibility.
+
+        Parameters:
+        - file_path (str): Path to the PDF file to load.
+
+        Returns:
+        - list: A list of Document objects containing the PDF content.
+        """
+        return self.load_pdf(file_path, backend="pdfplumber")
+
+    def load_online_pdf(self, url):
+        """
+        Load an online PDF from the given URL using OnlinePDFLoader.
+        
+        Parameters:
+        - url (str): The URL of the online PDF to load.
+        
+        Returns:
+        - list: A list of Document objects containing the PDF content.
+        
+        Raises:
+        - Exception: If an error occurs during the loading process.
+        """
+        try:
+            # Initialize OnlinePDFLoader and load the PDF content from the URL
+            from langchain_community.document_loaders import OnlinePDFLoader
+            loader = OnlinePDFLoader(url)
+            documents = loader.load()
+            return documents
+        except Exception:
+            logger.exception("Failed to load online PDF %s", url)
+            raise
+
+    def fetch_data_from_url(self, url):
+        """
+        Fetch data from a web URL using WebBaseLoader.
+        
+        Parameters:
+        - url (str): The web URL to fetch data from.
+        
+        Returns:
+        - list: A list of Document objects containing the web data.
+        
+        Raises:
+        - Exception: If an error occurs during the fetching process.
+        """
+        try:
+            # Initialize WebBaseLoader and fetch data from the URL
+            from langchain_community.document_loaders import WebBaseLoader
+            loader = WebBaseLoader(web_paths=[url])
+            loader.session = self._http_session()  # Reuse pooled connections
+            documents = loader.load()
+            return documents
+        except Exception:
+            logger.exception("Failed to fetch data from URL %s", url)
+            raise
+
+    def fetch_data_from_urls_pooled(self, urls, max_workers=16):
+        """
+        Fetch several web URLs over the shared pooled session using a thread
+        pool. Threaded alternative to fetch_data_from_urls for callers that
+        want WebBaseLoader's HTML handling rather than raw aiohttp bodies.
+
+        Parameters:
+        - urls (list): The web URLs to fetch data from.
+        - max_workers (int): Maximum number of fetches in flight.
+
+        Returns:
+        - list: A list of Document objects from all URLs, in input order.
+
+        Raises:
+        - Exception: If an error occurs during the fetching process.
+        """
+        try:
+            from langchain_community.document_loaders import WebBaseLoader
+            session = self._http_session()
+
+            def fetch_one(url):
+                loader = WebBaseLoader(web_paths=[url])
+                loader.session = session  # Reuse pooled connections
+                return loader.load()
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+                results = list(executor.map(fetch_one, urls))
+            documents = [document for result in results for document in result]
+            return documents
+        except Exception:
+            logger.exception("Failed to fetch data from URLs")
+            raise
+
+    async def fetch_data_from_urls(self, urls):
+        """
+        Fetch several web URLs concurrently over one aiohttp session.
+        Fetching is latency-bound, so overlapping the requests amortizes the
+        per-request round-trip across all URLs instead of paying it serially.
+
+        Parameters:
+        - urls (list): The web URLs to fetch data from.
+
+        Returns:
+        - list: A list of Document objects, one per URL, in input order.
+
+        Raises:
+        - Exception: If an error occurs during the fetching process.
+        """
+        try:
+            import aiohttp
+            async with aiohttp.ClientSession() as session:
+                async def fetch(url):
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.text()
+                bodies = await asyncio.gather(*[fetch(url) for url in urls])
+            documents = [
+                Document(page_content=body, metadata={"source": url})
+                for url, body in zip(urls, bodies)
+            ]
+            return documents
+        except Exception:
+            logger.exception("Failed to fetch data from URLs")
+            raise
+
+    def fetch_many(self, urls):
+        """
+        Sync wrapper around fetch_data_from_urls for callers without an
+        event loop.
+
+        Parameters:
+        - urls (list): The web URLs to fetch data from.
+
+        Returns:
+        - list: A list of Document objects, one per URL, in input order.
+        """
+        return asyncio.run(self.fetch_data_from_urls(urls))
+
+    def load_online_pdfs(self, urls):
+        """
+        Download several online PDFs concurrently, then parse each with
+        PyMuPDF straight from the in-memory bytes, avoiding disk roundtrips.
+
+        Parameters:
+        - urls (list): The URLs of the online PDFs to load.
+
+        Returns:
+        - list: A list of Document objects containing the PDFs' content.
+
+        Raises:
+        - Exception: If an error occurs during the loading process.
+        """
+        try:
+            import aiohttp
+            import fitz
+
+            async def download_all():
+                async with aiohttp.ClientSession() as session:
+                    async def fetch(url):
+                        async with session.get(url) as response:
+                            response.raise_for_status()
+                            return await response.read()
+                    return await asyncio.gather(*[fetch(url) for url in urls])
+            payloads = asyncio.run(download_all())
+            documents = []
+            for url, data in zip(urls, payloads):
+                pdf = fitz.open(stream=data, filetype="pdf")
+                try:
+                    for page_number in range(pdf.page_count):
+                        documents.append(
+                            Document(
+                                page_content=pdf[page_number].get_text("text"),
+                                metadata={"source": url, "page": page_number}
+                            )
+                        )
+                finally:
+                    pdf.close()
+            return documents
+        except Exception:
+            logger.exception("Failed to load online PDFs")
+            raise
+
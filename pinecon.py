@@ -1,188 +1,357 @@
-from pinecone import Pinecone, ServerlessSpec
-from langchain_pinecone import PineconeVectorStore
-from dotenv import load_dotenv
-load_dotenv()
-import os
-pinecone_key = os.getenv("PINECONE_API_KEY")
-
-class PineconeInsertRetrieval:
-    def __init__(self, api_key):
-        """
-        Initializes the PineconeInsertRetrieval class with the provided API key.
-        """
-        self.api_key = api_key
-
-    def check_index(self, index):
-        """
-        Checks if the specified index exists in Pinecone.
-        
-        Args:
-            index (str): The name of the index to check.
-        
-        Returns:
-            str: A message indicating whether the index is found or not.
-        """
-        pc = Pinecone(api_key=self.api_key)  # Initialize Pinecone client
-        indexes = pc.list_indexes().names()  # Get the list of indexes
-        if index not in indexes:  # If the index is not found
-            return "Not Found index"
-        elif index in indexes:  # If the index exists
-            return f"Your index name {index} Found"
-    
-    def create_index(self, index_name, dimensions):
-        """
-        Creates a new index in Pinecone with the specified name and dimensions.
-        
-        Args:
-            index_name (str): The name of the index to create.
-            dimensions (int): The number of dimensions for the index.
-        
-        Returns:
-            str: The name of the created index or an error message.
-        """
-        try:
-            pc = Pinecone(api_key=self.api_key)  # Initialize Pinecone client
-            # Create a new index with the specified parameters
-            pc.create_index(
-                name=index_name,
-                dimension=dimensions,
-                metric="cosine",  # Similarity metric used (Cosine similarity)
-                spec=ServerlessSpec(  # Serverless configuration for the index
-                    cloud='aws', 
-                    region='us-east-1'
-                )
-            )
-            print(f"Your index {index_name} created successfully")  # Success message
-            return index_name
-        except Exception as ex:  # Handle exceptions
-            return f"Sorry, try again. {ex}"
-        
-    def delete_index_name(self, index_name):
-        """
-        Deletes the specified index from Pinecone.
-        
-        Args:
-            index_name (str): The name of the index to delete.
-        
-        Returns:
-            str: A success or error message.
-        """
-        try:
-            pc = Pinecone(api_key=self.api_key)  # Initialize Pinecone client
-            indexes = pc.list_indexes().names()  # Get the list of indexes
-            if index_name not in indexes:  # If the index doesn't exist
-                return f"Index '{index_name}' does not exist."
-            pc.delete_index(index_name)  # Delete the specified index
-            return f"Index '{index_name}' deleted successfully."
-        except Exception as ex:  # Handle exceptions
-            return f"Failed to delete index '{index_name}': {ex}"
-
-    def delete_name_spaces(self, index_name, name_space):
-        """
-        Deletes a specific namespace from a given index in Pinecone.
-        
-        Args:
-            index_name (str): The name of the index containing the namespace.
-            name_space (str): The name of the namespace to delete.
-        
-        Returns:
-            str: A success or error message.
-        """
-        try:
-            # Initialize the index
-            pc = Pinecone(api_key=self.api_key)
-            index = pc.Index(index_name)  # Get the index object
-            # Delete the specified namespace
-            response = index.delete(namespace=name_space, delete_all=True)
-            if response == {}:  # If deletion is successful
-                return f"Namespace '{name_space}' deleted successfully from index '{index_name}'."
-            else:
-                return f"Unexpected response: {response}"  # If the response is unexpected
-        except Exception:  # Handle exceptions
-            return f"An error occurred: Failed to delete Namespace"
-    
-    def insert_data_in_namespace(self, documents, embeddings, index_name, name_space):
-        """
-        Inserts data into a specific namespace within an index.
-        
-        Args:
-            documents (list): A list of documents to be inserted.
-            embeddings (object): The embeddings to be used for the documents.
-            index_name (str): The name of the index where the namespace exists.
-            name_space (str): The name of the namespace where the data will be inserted.
-        
-        Returns:
-            object: The created Pinecone vector store or an error message.
-        """
-        try:
-            doc_search = PineconeVectorStore.from_documents(
-                documents,
-                embeddings,
-                index_name=index_name,
-                namespace=name_space
-            )
-            print(f"Your Namespace {name_space} is created successfully")  # Success message
-            return doc_search
-        except Exception as ex:  # Handle exceptions
-            return f"Failed to create namespace: {ex}"
-    
-    def insert_data_in_index(self, documents, embeddings, index_name):
-        """
-        Inserts data directly into a specified index without using namespaces.
-        
-        Args:
-            documents (list): A list of documents to be inserted.
-            embeddings (object): The embeddings to be used for the documents.
-            index_name (str): The name of the index where the data will be inserted.
-        
-        Returns:
-            str: A success message or error message.
-        """
-        try:
-            PineconeVectorStore.from_documents(
-                documents,
-                embedding=embeddings,
-                index_name=index_name
-            )
-            print(f"Your data inserted into {index_name} successfully")  # Success message
-        except Exception as ex:  # Handle exceptions
-            return f"Failed to insert data into index: {ex}"
-
-    def retrieve_from_index_name(self, index_name, embeddings):
-        """
-        Retrieves data from a specified index.
-        
-        Args:
-            index_name (str): The name of the index to retrieve data from.
-            embeddings (object): The embeddings used for retrieving the data.
-        
-        Returns:
-            object: The retrieved Pinecone vector store or an error message.
-        """
-        try:
-            vectorstore = PineconeVectorStore.from_existing_index(
-                embedding=embeddings, index_name=index_name
-            )
-            return vectorstore
-        except Exception as ex:  # Handle exceptions
-            return f"Failed to load VectorStore: {ex}"
-        
-    def retrieve_from_namespace(self, index_name, embeddings, name_space):
-        """
-        Retrieves data from a specific namespace within an index.
-        
-        Args:
-            index_name (str): The name of the index containing the namespace.
-            embeddings (object): The embeddings used for retrieving the data.
-            name_space (str): The name of the namespace to retrieve data from.
-        
-        Returns:
-            object: The retrieved Pinecone vector store or an error message.
-        """
-        try:
-            vectorstore = PineconeVectorStore.from_existing_index(
-                embedding=embeddings, index_name=index_name, namespace=name_space
-            )
-            return vectorstore
-        except Exception as ex:  # Handle exceptions
-            return f"Failed to load VectorStore: {ex}"
+from pinecone import Pinecone, ServerlessSpec
+from langchain_pinecone import PineconeVectorStore
+from dotenv import load_dotenv
+load_dotenv()
+import asyncio
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+pinecone_key = os.getenv("PINECONE_API_KEY")
+
+logger = logging.getLogger(__name__)
+
+class PineconeInsertRetrieval:
+    # How long (seconds) a cached list_indexes() result stays valid.
+    INDEX_CACHE_TTL = 5.0
+
+    def __init__(self, api_key):
+        """
+        Initializes the PineconeInsertRetrieval class with the provided API key.
+        The Pinecone client is created once and reused; the index list is
+        cached for a short TTL so back-to-back checks don't each pay an
+        HTTPS round-trip.
+        """
+        self.api_key = api_key
+        self._pc = Pinecone(api_key=api_key)  # Reused Pinecone client
+        self._indexes_cache = None            # (timestamp, set of index names)
+        self._index_handles = {}              # Memoized pc.Index handles by name
+
+    def _index(self, index_name):
+        """
+        Returns a memoized Index handle. Building one resolves the index
+        host, so caching it removes that round-trip from every
+        insert/retrieve call after the first.
+
+        Args:
+            index_name (str): The name of the index.
+
+        Returns:
+            pinecone.Index: The cached index handle.
+        """
+        if index_name not in self._index_handles:
+            self._index_handles[index_name] = self._pc.Index(index_name)
+        return self._index_handles[index_name]
+
+    def _list_index_names(self):
+        """
+        Returns the set of existing index names, cached for INDEX_CACHE_TTL
+        seconds to avoid a round-trip per call.
+
+        Returns:
+            set: The names of the existing indexes.
+        """
+        now = time.monotonic()
+        if self._indexes_cache is None or now - self._indexes_cache[0] > self.INDEX_CACHE_TTL:
+            self._indexes_cache = (now, set(self._pc.list_indexes().names()))
+        return self._indexes_cache[1]
+
+    def check_index(self, index):
+        """
+        Checks if the specified index exists in Pinecone.
+
+        Args:
+            index (str): The name of the index to check.
+
+        Returns:
+            str: A message indicating whether the index is found or not.
+        """
+        # Single O(1) membership test against the cached set
+        return f"Your index name {index} Found" if index in self._list_index_names() else "Not Found index"
+
+    async def acheck_index(self, index):
+        """
+        Async variant of check_index; runs the blocking client call in a
+        thread so multiple checks can be overlapped with asyncio.gather.
+
+        Args:
+            index (str): The name of the index to check.
+
+        Returns:
+            str: A message indicating whether the index is found or not.
+        """
+        return await asyncio.to_thread(self.check_index, index)
+
+    async def acreate_index(self, index_name, dimensions):
+        """
+        Async variant of create_index; runs the blocking client call in a
+        thread.
+
+        Args:
+            index_name (str): The name of the index to create.
+            dimensions (int): The number of dimensions for the index.
+
+        Returns:
+            str: The name of the created index or an error message.
+        """
+        return await asyncio.to_thread(self.create_index, index_name, dimensions)
+
+    async def bulk_check_indexes(self, names):
+        """
+        Checks several indexes concurrently, overlapping the round-trips
+        instead of paying them serially.
+
+        Args:
+            names (list): The index names to check.
+
+        Returns:
+            list: A message per index, in the same order as names.
+        """
+        return await asyncio.gather(*[self.acheck_index(name) for name in names])
+
+    def create_index(self, index_name, dimensions):
+        """
+        Creates a new index in Pinecone with the specified name and dimensions.
+        
+        Args:
+            index_name (str): The name of the index to create.
+            dimensions (int): The number of dimensions for the index.
+        
+        Returns:
+            str: The name of the created index, a message if it already
+            exists, or an error message.
+        """
+        try:
+            if index_name in self._list_index_names():  # Already created: skip the API call
+                return f"Index '{index_name}' already exists."
+            # Create a new index with the specified parameters
+            self._pc.create_index(
+                name=index_name,
+                dimension=dimensions,
+                metric="cosine",  # Similarity metric used (Cosine similarity)
+                spec=ServerlessSpec(  # Serverless configuration for the index
+                    cloud='aws', 
+                    region='us-east-1'
+                )
+            )
+            if self._indexes_cache is not None:  # Keep the cache hot instead of refetching
+                self._indexes_cache[1].add(index_name)
+            logger.info("Index %s created successfully", index_name)  # Success message
+            return index_name
+        except Exception as ex:  # Handle exceptions
+            return f"Sorry, try again. {ex}"
+        
+    def delete_index_name(self, index_name):
+        """
+        Deletes the specified index from Pinecone.
+        
+        Args:
+            index_name (str): The name of the index to delete.
+        
+        Returns:
+            str: A success or error message.
+        """
+        try:
+            indexes = self._list_index_names()  # Cached list of indexes
+            if index_name not in indexes:  # If the index doesn't exist
+                return f"Index '{index_name}' does not exist."
+            self._pc.delete_index(index_name)  # Delete the specified index
+            if self._indexes_cache is not None:  # Keep the cache hot instead of refetching
+                self._indexes_cache[1].discard(index_name)
+            self._index_handles.pop(index_name, None)  # Handle is now stale
+            return f"Index '{index_name}' deleted successfully."
+        except Exception as ex:  # Handle exceptions
+            return f"Failed to delete index '{index_name}': {ex}"
+
+    def delete_name_spaces(self, index_name, name_space):
+        """
+        Deletes a specific namespace from a given index in Pinecone.
+        
+        Args:
+            index_name (str): The name of the index containing the namespace.
+            name_space (str): The name of the namespace to delete.
+        
+        Returns:
+            str: A success or error message.
+        """
+        try:
+            index = self._index(index_name)  # Cached index handle
+            # Delete the specified namespace
+            response = index.delete(namespace=name_space, delete_all=True)
+            if response == {}:  # If deletion is successful
+                return f"Namespace '{name_space}' deleted successfully from index '{index_name}'."
+            else:
+                return f"Unexpected response: {response}"  # If the response is unexpected
+        except Exception:  # Handle exceptions
+            return f"An error occurred: Failed to delete Namespace"
+
+    def delete_namespaces_bulk(self, index_name, namespaces):
+        """
+        Deletes several namespaces from an index concurrently. Each delete is
+        a blocking API round-trip, so issuing them from a thread pool cuts
+        wall time to roughly one round-trip instead of one per namespace.
+
+        Args:
+            index_name (str): The name of the index containing the namespaces.
+            namespaces (list): The names of the namespaces to delete.
+
+        Returns:
+            dict: Maps each namespace to "ok" or the error message.
+        """
+        if not namespaces:  # ThreadPoolExecutor rejects max_workers=0
+            return {}
+        index = self._index(index_name)  # One cached index handle for all deletes
+
+        def delete_one(name_space):
+            try:
+                index.delete(namespace=name_space, delete_all=True)
+                return "ok"
+            except Exception as ex:  # Handle exceptions per namespace
+                return f"Failed to delete Namespace: {ex}"
+
+        with ThreadPoolExecutor(max_workers=min(16, len(namespaces))) as executor:
+            results = executor.map(delete_one, namespaces)
+        return dict(zip(namespaces, results))
+
+    def _embed_documents(self, documents, embeddings, batch_size=256):
+        """
+        Embeds all documents up front in fixed-size batches, running the
+        batches through a thread pool so rate-limited providers keep several
+        requests in flight instead of embedding one small batch at a time.
+
+        Args:
+            documents (list): The documents to embed.
+            embeddings (object): The embedding model.
+            batch_size (int): Number of texts per embed_documents call.
+
+        Returns:
+            list: One vector per document, in input order.
+        """
+        texts = [doc.page_content for doc in documents]
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) == 1:
+            return embeddings.embed_documents(batches[0])
+        with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+            results = executor.map(embeddings.embed_documents, batches)
+        return [vector for result in results for vector in result]
+
+    def _bulk_upsert(self, documents, embeddings, index_name, name_space=None, concurrency=32):
+        """
+        Embeds the documents once and upserts them in batches of 100 with
+        async_req=True, so multiple upsert requests stay in flight at the
+        same time instead of paying one round-trip per batch. At most
+        `concurrency` requests are outstanding at once.
+
+        Args:
+            documents (list): The documents to insert.
+            embeddings (object): The embedding model.
+            index_name (str): The target index.
+            name_space (str): Optional namespace to insert into.
+            concurrency (int): Maximum number of upserts in flight.
+        """
+        vectors = self._embed_documents(documents, embeddings)
+        # uuid4 IDs: sequential ints restart at 0 each call, so a second
+        # insert would silently overwrite the first call's vectors.
+        payload = [
+            (str(uuid.uuid4()), vector, {"text": doc.page_content, **doc.metadata})
+            for vector, doc in zip(vectors, documents)
+        ]
+        index = self._index(index_name)
+        batches = [payload[i:i + 100] for i in range(0, len(payload), 100)]
+        # Issue batches in waves of `concurrency`, draining each wave before
+        # starting the next so memory and outstanding requests stay bounded.
+        for wave_start in range(0, len(batches), concurrency):
+            futures = [
+                index.upsert(vectors=batch, namespace=name_space, async_req=True)
+                for batch in batches[wave_start:wave_start + concurrency]
+            ]
+            for future in futures:  # Wait for all in-flight batches
+                future.get()
+
+    def insert_data_in_namespace(self, documents, embeddings, index_name, name_space):
+        """
+        Inserts data into a specific namespace within an index. Embeddings
+        are precomputed in bulk and upserted with overlapping batches rather
+        than the sequential from_documents path.
+
+        Args:
+            documents (list): A list of documents to be inserted.
+            embeddings (object): The embeddings to be used for the documents.
+            index_name (str): The name of the index where the namespace exists.
+            name_space (str): The name of the namespace where the data will be inserted.
+
+        Returns:
+            object: The created Pinecone vector store or an error message.
+        """
+        try:
+            self._bulk_upsert(documents, embeddings, index_name, name_space=name_space)
+            doc_search = PineconeVectorStore(
+                index=self._index(index_name),
+                embedding=embeddings,
+                namespace=name_space
+            )
+            logger.info("Namespace %s created successfully", name_space)  # Success message
+            return doc_search
+        except Exception as ex:  # Handle exceptions
+            return f"Failed to create namespace: {ex}"
+
+    def insert_data_in_index(self, documents, embeddings, index_name, concurrency=32):
+        """
+        Inserts data directly into a specified index without using namespaces.
+        Embeddings are precomputed in bulk and upserted with overlapping
+        batches rather than the sequential from_documents path.
+
+        Args:
+            documents (list): A list of documents to be inserted.
+            embeddings (object): The embeddings to be used for the documents.
+            index_name (str): The name of the index where the data will be inserted.
+            concurrency (int): Maximum number of upsert requests in flight.
+
+        Returns:
+            str: A success message or error message.
+        """
+        try:
+            self._bulk_upsert(documents, embeddings, index_name, concurrency=concurrency)
+            logger.info("Data inserted into %s successfully", index_name)  # Success message
+        except Exception as ex:  # Handle exceptions
+            return f"Failed to insert data into index: {ex}"
+
+    def retrieve_from_index_name(self, index_name, embeddings):
+        """
+        Retrieves data from a specified index.
+        
+        Args:
+            index_name (str): The name of the index to retrieve data from.
+            embeddings (object): The embeddings used for retrieving the data.
+        
+        Returns:
+            object: The retrieved Pinecone vector store or an error message.
+        """
+        try:
+            vectorstore = PineconeVectorStore(
+                index=self._index(index_name), embedding=embeddings
+            )
+            return vectorstore
+        except Exception as ex:  # Handle exceptions
+            return f"Failed to load VectorStore: {ex}"
+        
+    def retrieve_from_namespace(self, index_name, embeddings, name_space):
+        """
+        Retrieves data from a specific namespace within an index.
+        
+        Args:
+            index_name (str): The name of the index containing the namespace.
+            embeddings (object): The embeddings used for retrieving the data.
+            name_space (str): The name of the namespace to retrieve data from.
+        
+        Returns:
+            object: The retrieved Pinecone vector store or an error message.
+        """
+        try:
+            vectorstore = PineconeVectorStore(
+                index=self._index(index_name), embedding=embeddings, namespace=name_space
+            )
+            return vectorstore
+        except Exception as ex:  # Handle exceptions
+            return f"Failed to load VectorStore: {ex}"
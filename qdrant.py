@@ -1,101 +1,189 @@
-from qdrant_client import QdrantClient
-from langchain_qdrant import QdrantVectorStore , Qdrant
-from qdrant_client import QdrantClient, models
-from dotenv import load_dotenv
-load_dotenv()
-import os
-
-class QdrantInsertRetrievalAll:
-    def __init__(self, api_key, url):
-        """
-        Initialize the QdrantInsertRetrievalAll class with API key and URL.
-        
-        Parameters:
-        - api_key (str): The API key for authenticating with the Qdrant service.
-        - url (str): The URL endpoint for the Qdrant instance.
-        """
-        self.url = url 
-        self.api_key = api_key
-
-    # Method to insert documents into Qdrant vector store
-    def insertion(self, text, embeddings, collection_name):
-        """
-        Inserts documents into the Qdrant vector store.
-        
-        Parameters:
-        - text (list): The list of documents to be inserted into the collection.
-        - embeddings (object): The embedding model to generate vectors for the text.
-        - collection_name (str): The name of the collection to insert the documents into.
-        
-        Returns:
-        - qdrant (QdrantVectorStore): The Qdrant vector store object after insertion.
-        """
-        qdrant = QdrantVectorStore.from_documents(
-            text,
-            embeddings,
-            url=self.url,
-            prefer_grpc=True,
-            api_key=self.api_key,
-            collection_name=collection_name,
-        )
-        print("Insertion successful")
-        return qdrant
-
-    # Method to retrieve documents from Qdrant vector store
-    def retrieval(self, collection_name, embeddings):
-        """
-        Retrieves documents from the Qdrant vector store.
-        
-        Parameters:
-        - collection_name (str): The name of the collection from which to retrieve documents.
-        - embeddings (object): The embedding model to generate vectors for querying.
-        
-        Returns:
-        - qdrant_store (Qdrant): The Qdrant vector store with the specified collection.
-        """
-        qdrant_client = QdrantClient(
-            url=self.url,
-            api_key=self.api_key,
-        )
-        qdrant_store = Qdrant(qdrant_client, collection_name=collection_name, embeddings=embeddings)
-        return qdrant_store
-    
-    # Method to delete a collection from Qdrant
-    def delete_collection(self, collection_name):
-        """
-        Deletes a collection from Qdrant.
-        
-        Parameters:
-        - collection_name (str): The name of the collection to be deleted.
-        
-        Returns:
-        - collection_name (str): The name of the deleted collection.
-        """
-        qdrant_client = QdrantClient(
-            url=self.url,
-            api_key=self.api_key,
-        )
-        qdrant_client.delete_collection(collection_name)
-        return collection_name
-    
-    # Method to create a new collection in Qdrant with cosine similarity
-    def create_collection(self, collection_name):
-        """
-        Creates a new collection in Qdrant with the cosine similarity metric.
-        
-        Parameters:
-        - collection_name (str): The name of the collection to be created.
-        
-        Returns:
-        - collection_name (str): The name of the newly created collection.
-        """
-        qdrant_client = QdrantClient(
-            url=self.url,
-            api_key=self.api_key,
-        )
-        qdrant_client.create_collection(
-            collection_name,
-            vectors_config=models.VectorParams(size=384, distance=models.Distance.COSINE)
-        )
-        print(f"Your collection {collection_name} created successfully")
-        return collection_name
+from qdrant_client import QdrantClient
+from langchain_qdrant import QdrantVectorStore , Qdrant
+from qdrant_client import QdrantClient, AsyncQdrantClient, models
+from dotenv import load_dotenv
+load_dotenv()
+import asyncio
+import logging
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+class QdrantInsertRetrievalAll:
+    def __init__(self, api_key, url):
+        """
+        Initialize the QdrantInsertRetrievalAll class with API key and URL.
+        
+        Parameters:
+        - api_key (str): The API key for authenticating with the Qdrant service.
+        - url (str): The URL endpoint for the Qdrant instance.
+        """
+        self.url = url
+        self.api_key = api_key
+        # One client for all calls; QdrantClient keeps its HTTP/gRPC
+        # connections alive, so rebuilding it per method wastes a handshake.
+        self.client = QdrantClient(
+            url=self.url,
+            api_key=self.api_key,
+            prefer_grpc=True,
+        )
+
+    def close(self):
+        """
+        Closes the shared client's connections. Call when done with the
+        instance, or use it as a context manager.
+        """
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Method to insert documents into Qdrant vector store
+    def insertion(self, text, embeddings, collection_name):
+        """
+        Inserts documents into the Qdrant vector store over the shared
+        client, creating the collection first if it does not exist —
+        from_documents would open (and leak) a fresh client per call.
+
+        Parameters:
+        - text (list): The list of documents to be inserted into the collection.
+        - embeddings (object): The embedding model to generate vectors for the text.
+        - collection_name (str): The name of the collection to insert the documents into.
+
+        Returns:
+        - qdrant (QdrantVectorStore): The Qdrant vector store object after insertion.
+        """
+        if not self.client.collection_exists(collection_name):
+            # One probe embedding sizes the new collection
+            size = len(embeddings.embed_query(text[0].page_content))
+            self.client.create_collection(
+                collection_name,
+                vectors_config=models.VectorParams(size=size, distance=models.Distance.COSINE)
+            )
+        qdrant = QdrantVectorStore(
+            client=self.client,
+            collection_name=collection_name,
+            embedding=embeddings,
+        )
+        qdrant.add_documents(text)
+        logger.info("Insertion successful")
+        return qdrant
+
+    # Method to insert documents with batched, overlapped async upserts
+    async def insertion_async(self, text, embeddings, collection_name, batch_size=128, parallel=8):
+        """
+        Inserts documents into Qdrant with batched async upserts.
+        Embeddings are computed once for the whole corpus, then PointStruct
+        batches are kept in flight concurrently (up to `parallel` at a time)
+        so upload throughput is no longer bounded by one round-trip per batch.
+
+        Parameters:
+        - text (list): The list of documents to be inserted into the collection.
+        - embeddings (object): The embedding model to generate vectors for the text.
+        - collection_name (str): The name of the collection to insert the documents into.
+        - batch_size (int): Number of points per upsert request.
+        - parallel (int): Maximum number of upsert requests in flight.
+
+        Returns:
+        - qdrant (Qdrant): A Qdrant vector store bound to the collection.
+        """
+        vectors = await embeddings.aembed_documents([doc.page_content for doc in text])
+        if not self.client.collection_exists(collection_name):
+            self.client.create_collection(
+                collection_name,
+                vectors_config=models.VectorParams(size=len(vectors[0]), distance=models.Distance.COSINE)
+            )
+        points = [
+            models.PointStruct(
+                id=str(uuid.uuid4()),
+                vector=vector,
+                payload={"page_content": doc.page_content, "metadata": doc.metadata},
+            )
+            for doc, vector in zip(text, vectors)
+        ]
+        batches = [points[i:i + batch_size] for i in range(0, len(points), batch_size)]
+        async_client = AsyncQdrantClient(url=self.url, api_key=self.api_key)
+        semaphore = asyncio.Semaphore(parallel)
+        async def upsert_batch(batch):
+            async with semaphore:
+                await async_client.upsert(collection_name, points=batch, wait=False)
+        try:
+            await asyncio.gather(*[upsert_batch(batch) for batch in batches])
+        finally:
+            await async_client.close()
+        logger.info("Insertion successful")
+        return Qdrant(self.client, collection_name=collection_name, embeddings=embeddings)
+
+    # Method to retrieve documents from Qdrant vector store
+    def retrieval(self, collection_name, embeddings):
+        """
+        Retrieves documents from the Qdrant vector store.
+        
+        Parameters:
+        - collection_name (str): The name of the collection from which to retrieve documents.
+        - embeddings (object): The embedding model to generate vectors for querying.
+        
+        Returns:
+        - qdrant_store (Qdrant): The Qdrant vector store with the specified collection.
+        """
+        qdrant_store = Qdrant(self.client, collection_name=collection_name, embeddings=embeddings)
+        return qdrant_store
+    
+    # Method to delete a collection from Qdrant
+    def delete_collection(self, collection_name):
+        """
+        Deletes a collection from Qdrant.
+        
+        Parameters:
+        - collection_name (str): The name of the collection to be deleted.
+        
+        Returns:
+        - collection_name (str): The name of the deleted collection.
+        """
+        self.client.delete_collection(collection_name)
+        return collection_name
+    
+    # Method to create a new collection in Qdrant with cosine similarity
+    def create_collection(self, collection_name, size=384, quantization="scalar"):
+        """
+        Creates a new collection in Qdrant with the cosine similarity metric.
+        Vectors are quantized by default: int8 scalar quantization cuts the
+        in-RAM vector footprint 4x (binary cuts it 32x) while the full
+        float32 originals stay on disk for rescoring.
+
+        Parameters:
+        - collection_name (str): The name of the collection to be created.
+        - size (int): Dimensionality of the stored vectors.
+        - quantization (str): "scalar" for int8, "binary" for 1-bit, or None
+          to store plain float32 vectors in RAM.
+
+        Returns:
+        - collection_name (str): The name of the newly created collection.
+        """
+        if quantization == "scalar":
+            quantization_config = models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, always_ram=True)
+            )
+        elif quantization == "binary":
+            quantization_config = models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        else:
+            quantization_config = None
+        self.client.create_collection(
+            collection_name,
+            vectors_config=models.VectorParams(
+                size=size,
+                distance=models.Distance.COSINE,
+                # Keep raw float32 vectors on disk; search runs over the
+                # quantized copy held in RAM.
+                on_disk=quantization_config is not None
+            ),
+            quantization_config=quantization_config
+        )
+        logger.info("Collection %s created successfully", collection_name)
+        return collection_name
@@ -1,139 +1,971 @@
-from langchain_text_splitters import RecursiveCharacterTextSplitter, CharacterTextSplitter
-from langchain.schema import Document
-from bs4 import BeautifulSoup
-from typing import List, Any
-
-class LangchainSplitters:
-    def __init__(self, docs: List[Document]):
-        """
-        Initialize LangchainSplitters with a list of Document objects.
-        
-        Parameters:
-            docs (List[Document]): A list of Document objects to be processed and split.
-        """
-        self.docs = docs
-
-    def html_splitter(self, chunk_size: int = 100, chunk_overlap: int = 20, headers_to_split_on: List[str] = ["h1", "h2", "h3", "p"]) -> List[Document]:
-        """
-        Splits HTML content in the documents based on specified HTML headers and paragraphs.
-        
-        Parameters:
-            chunk_size (int): Maximum size of each chunk.
-            chunk_overlap (int): Overlap between consecutive chunks.
-            headers_to_split_on (List[str]): HTML tags to use for splitting (e.g., "h1", "h2").
-            
-        Returns:
-            List[Document]: A list of chunked Document objects with added metadata.
-        """
-        try:
-            section_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                length_function=len,
-                is_separator_regex=False
-            )
-
-            all_chunked_docs = []
-            for doc_index, doc in enumerate(self.docs):
-                # Parse HTML content
-                soup = BeautifulSoup(doc.page_content, "html.parser")
-                sections = [(header_tag, element.get_text()) for header_tag in headers_to_split_on for element in soup.find_all(header_tag)]
-                
-                chunked_docs = []
-                for idx, (header, text) in enumerate(sections):
-                    chunks = section_splitter.split_text(text)
-                    for chunk_idx, chunk in enumerate(chunks):
-                        chunked_docs.append(
-                            Document(
-                                page_content=chunk,
-                                metadata={
-                                    **doc.metadata,
-                                    "chunkno": f"{idx+1}-{chunk_idx+1}",
-                                    "header_type": header
-                                }
-                            )
-                        )
-                all_chunked_docs.extend(chunked_docs)
-
-            return all_chunked_docs
-
-        except Exception as e:
-            print(f"Error in html_splitter: {str(e)}")
-            return []
-
-    def recursive_text_splitter(self, chunk_size: int = 900, chunk_overlap: int = 100) -> List[Document]:
-        """
-        Splits text in each document recursively based on character length.
-        
-        Parameters:
-            chunk_size (int): Maximum size of each chunk.
-            chunk_overlap (int): Overlap between consecutive chunks.
-            
-        Returns:
-            List[Document]: A list of chunked Document objects with added metadata.
-        """
-        try:
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                length_function=len,
-                is_separator_regex=False
-            )
-
-            all_chunked_docs = []
-            for doc_index, doc in enumerate(self.docs):
-                splits = text_splitter.split_text(doc.page_content)
-                chunked_docs = [
-                    Document(
-                        page_content=chunk,
-                        metadata={**doc.metadata, "chunkno": idx + 1}
-                    )
-                    for idx, chunk in enumerate(splits)
-                ]
-                all_chunked_docs.extend(chunked_docs)
-
-            return all_chunked_docs
-
-        except Exception as e:
-            print(f"Error in recursive_text_splitter: {str(e)}")
-            return []
-
-    def character_text_splitter(self, chunk_size: int = 1000, chunk_overlap: int = 200, separator: str = "\n") -> List[Document]:
-        """
-        Splits text in each document based on a character separator.
-        
-        Parameters:
-            chunk_size (int): Maximum size of each chunk.
-            chunk_overlap (int): Overlap between consecutive chunks.
-            separator (str): Character or string to separate chunks.
-            
-        Returns:
-            List[Document]: A list of chunked Document objects with added metadata.
-        """
-        try:
-            text_splitter = CharacterTextSplitter(
-                separator=separator,
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                length_function=len,
-                is_separator_regex=False
-            )
-
-            all_chunked_docs = []
-            for doc_index, doc in enumerate(self.docs):
-                splits = text_splitter.split_text(doc.page_content)
-                chunked_docs = [
-                    Document(
-                        page_content=chunk,
-                        metadata={**doc.metadata, "chunkno": idx + 1}
-                    )
-                    for idx, chunk in enumerate(splits)
-                ]
-                all_chunked_docs.extend(chunked_docs)
-
-            return all_chunked_docs
-
-        except Exception as e:
-            print(f"Error in character_text_splitter: {str(e)}")
-            return []
-
+from langchain_text_splitters import RecursiveCharacterTextSplitter, CharacterTextSplitter
+from langchain.schema import Document
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from html import unescape
+from types import MappingProxyType
+from typing import List, Any, Iterable, Mapping, Tuple
+import io
+import os
+import re
+
+# model_construct (pydantic v2) / construct (v1) builds a Document without
+# re-validating fields the split loop already guarantees.
+_construct = getattr(Document, "model_construct", None) or Document.construct
+
+@dataclass(slots=True)
+class LightDoc:
+    """
+    Slots-based stand-in for langchain's Document inside the split hot
+    loops. A pydantic Document pays validation and per-instance __dict__
+    overhead on every construction; this holds the same two fields in fixed
+    slots and is converted to real Documents once, at the API boundary.
+    """
+    page_content: str
+    metadata: Mapping[str, Any]
+
+    def to_langchain(self) -> Document:
+        """
+        Converts to a langchain Document, skipping field validation.
+
+        Returns:
+            Document: The equivalent langchain Document.
+        """
+        return _construct(page_content=self.page_content, metadata=self.metadata)
+
+def _to_langchain(light_docs: List[LightDoc]) -> List[Document]:
+    """
+    Bulk-converts LightDocs to langchain Documents via the validation-free
+    constructor, into a pre-sized list.
+
+    Parameters:
+        light_docs (List[LightDoc]): The lightweight chunk records.
+
+    Returns:
+        List[Document]: The equivalent langchain Documents, in order.
+    """
+    docs = [None] * len(light_docs)
+    for i, light in enumerate(light_docs):
+        docs[i] = _construct(page_content=light.page_content, metadata=light.metadata)
+    return docs
+
+# Matches any remaining tag inside an extracted section body.
+_TAG_RE = re.compile(r"<[^>]+>")
+
+@lru_cache(maxsize=16)
+def _get_header_pattern(tags: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Compiles (and caches) a single alternation matching all the requested
+    header/paragraph tags, so section extraction is one linear regex pass
+    over the raw HTML instead of one DOM walk per tag.
+
+    Parameters:
+        tags (Tuple[str, ...]): The tag names to match (e.g. ("h1", "p")).
+
+    Returns:
+        re.Pattern: The compiled pattern; group 1 is the tag, group 2 the body.
+    """
+    alternation = "|".join(re.escape(tag) for tag in tags)
+    return re.compile(r"<(%s)\b[^>]*>(.*?)</\1\s*>" % alternation, re.DOTALL | re.IGNORECASE)
+
+def _strip_tags(fragment: str) -> str:
+    """
+    Drops any nested tags from a section body and unescapes HTML entities.
+
+    Parameters:
+        fragment (str): Raw inner HTML of a matched section.
+
+    Returns:
+        str: The plain text of the section.
+    """
+    return unescape(_TAG_RE.sub("", fragment))
+
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:  # Fall back to the compiled-regex scan
+    _SelectolaxParser = None
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to langchain's per-separator scans
+    ahocorasick = None
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # Streaming iterparse unavailable; sections are listed eagerly
+    _lxml_etree = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+    import json
+
+try:
+    # Compiled Document-construction loop (see _splitter_core.pyx; build
+    # with `cythonize -i _splitter_core.pyx`).
+    from _splitter_core import build_documents as _build_documents
+except ImportError:
+    def _build_documents(chunks: List[str], base) -> List[LightDoc]:
+        """
+        Pure-Python fallback for the compiled chunk-materialization loop:
+        pre-sized list populated by index assignment, no per-element append.
+
+        Parameters:
+            chunks (List[str]): The chunk texts, in order.
+            base: Shared read-only base metadata for all chunks.
+
+        Returns:
+            List[LightDoc]: One LightDoc per chunk, chunkno starting at 1.
+        """
+        docs = [None] * len(chunks)
+        for i, chunk in enumerate(chunks):
+            docs[i] = LightDoc(
+                page_content=chunk,
+                metadata=ChainMap({"chunkno": i + 1}, base)
+            )
+        return docs
+
+def _extract_sections(html: str, tags: Tuple[str, ...]) -> List[Tuple[str, str]]:
+    """
+    Extracts (tag, text) sections for the requested tags in document order.
+    Uses selectolax (C Lexbor engine, one parse + one CSS query) when
+    installed — it handles nesting and malformed markup that the regex scan
+    cannot — and falls back to the single-pass compiled regex otherwise.
+
+    Parameters:
+        html (str): The raw HTML to extract sections from.
+        tags (Tuple[str, ...]): The tag names to extract (e.g. ("h1", "p")).
+
+    Returns:
+        List[Tuple[str, str]]: (tag name, section text) pairs in document order.
+    """
+    if _SelectolaxParser is not None:
+        tree = _SelectolaxParser(html)
+        if tree.root is None:
+            return []
+        wanted = frozenset(tags)
+        # One pre-order traversal keeps matches in document order; css()
+        # returns them grouped per selector instead. text(deep=True)
+        # collects each subtree in one C-level walk, concatenating text
+        # nodes exactly like lxml's itertext in the streaming extractor.
+        return [
+            (node.tag, node.text(deep=True))
+            for node in tree.root.traverse()
+            if node.tag in wanted
+        ]
+    pattern = _get_header_pattern(tags)
+    return [
+        (match.group(1).lower(), _strip_tags(match.group(2)))
+        for match in pattern.finditer(html)
+    ]
+
+def _iter_sections(html: str, tags: Tuple[str, ...]):
+    """
+    Streaming counterpart of _extract_sections: yields (tag, text) pairs as
+    they are parsed. With lxml installed, iterparse emits each matching
+    element on its end event and the node is cleared immediately after its
+    text is pulled, so the full DOM is never held at once. Otherwise the
+    eager extraction runs and its list is yielded from.
+
+    Parameters:
+        html (str): The raw HTML to extract sections from.
+        tags (Tuple[str, ...]): The tag names to extract (e.g. ("h1", "p")).
+
+    Yields:
+        Tuple[str, str]: (tag name, section text) pairs in document order.
+    """
+    if _lxml_etree is not None:
+        source = io.BytesIO(html.encode("utf-8"))
+        for _, element in _lxml_etree.iterparse(source, events=("end",), tag=tags, html=True):
+            # itertext runs the subtree walk in C, like tostring(method="text")
+            yield element.tag, "".join(element.itertext())
+            element.clear(keep_tail=True)  # Drop the subtree we just consumed
+        return
+    yield from _extract_sections(html, tags)
+
+def _flatten(results: List[List[LightDoc]]) -> List[LightDoc]:
+    """
+    Flattens per-document chunk lists into one list, pre-sized from the
+    known total so the result never pays list-growth reallocation, and
+    filled with slice assignment instead of per-element appends.
+
+    Parameters:
+        results (List[List[LightDoc]]): Per-document chunk lists.
+
+    Returns:
+        List[LightDoc]: All chunks in input order.
+    """
+    total = sum(map(len, results))
+    flat = [None] * total
+    i = 0
+    for result in results:
+        flat[i:i + len(result)] = result
+        i += len(result)
+    return flat
+
+def _word_count(text: str) -> int:
+    """
+    Approximate word-count length for token-budget chunking. str.count runs
+    as a single C-level scan, far cheaper than splitting the string.
+
+    Parameters:
+        text (str): The candidate chunk.
+
+    Returns:
+        int: Approximate number of words in the text.
+    """
+    return text.count(" ") + 1
+
+def _length_function(length_mode: str):
+    """
+    Maps a length mode to the splitter's length callback. Char mode returns
+    None so the splitter uses its built-in default (len) without wrapping an
+    explicitly-passed Python callable per measurement.
+
+    Parameters:
+        length_mode (str): "char" for character lengths, "word" for
+            approximate word counts.
+
+    Returns:
+        callable: The length function, or None for the default.
+    """
+    if length_mode == "word":
+        return _word_count
+    return None
+
+@lru_cache(maxsize=8)
+def _get_separator_automaton(separators: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """
+    Builds (and caches) an Aho-Corasick automaton over the non-empty
+    separators, so one linear scan finds every occurrence of every
+    separator at once.
+
+    Parameters:
+        separators (Tuple[str, ...]): The separator strings to index.
+
+    Returns:
+        ahocorasick.Automaton: The compiled automaton.
+    """
+    automaton = ahocorasick.Automaton()
+    for priority, separator in enumerate(separators):
+        automaton.add_word(separator, (priority, separator))
+    automaton.make_automaton()
+    return automaton
+
+@lru_cache(maxsize=8)
+def _get_separator_pattern(separators: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Compiles (and caches) an alternation over the separators, the fallback
+    cut scan when pyahocorasick is not installed. Each separator gets its
+    own group so the matched alternative (its priority) is recoverable via
+    lastindex.
+
+    Parameters:
+        separators (Tuple[str, ...]): The separator strings to match.
+
+    Returns:
+        re.Pattern: The compiled alternation.
+    """
+    return re.compile("|".join("(%s)" % re.escape(separator) for separator in separators))
+
+def _separator_cuts(text: str, separators: Tuple[str, ...]) -> List[Tuple[int, int]]:
+    """
+    Finds every cut candidate (the position just after a separator) in one
+    linear scan — an Aho-Corasick pass when available, a compiled regex
+    alternation otherwise. Each position keeps the best (lowest) priority
+    of the separators ending there, so the packer can prefer e.g. a
+    paragraph break over a space.
+
+    Parameters:
+        text (str): The text to scan.
+        separators (Tuple[str, ...]): Non-empty separators, best first.
+
+    Returns:
+        List[Tuple[int, int]]: (position, priority) pairs sorted by position.
+    """
+    worst = len(separators)
+    cuts = {}
+    if ahocorasick is not None:
+        automaton = _get_separator_automaton(separators)
+        for end, (priority, _) in automaton.iter(text):
+            pos = end + 1
+            if priority < cuts.get(pos, worst):
+                cuts[pos] = priority
+    else:
+        pattern = _get_separator_pattern(separators)
+        for match in pattern.finditer(text):
+            pos = match.end()
+            priority = match.lastindex - 1
+            if priority < cuts.get(pos, worst):
+                cuts[pos] = priority
+    return sorted(cuts.items())
+
+def _iter_spans(text: str, cuts: List[Tuple[int, int]], size: int, overlap: int):
+    """
+    Greedily packs (start, end) chunk spans at the given cut positions,
+    taking the furthest cut among those at the best priority in each window
+    (so a paragraph break beats a later space) and hard-cutting when no
+    separator falls inside a window. Yields offset pairs only — no
+    substring is copied.
+
+    Parameters:
+        text (str): The text being spanned.
+        cuts (List[Tuple[int, int]]): Position-sorted (position, priority)
+            cut candidates from _separator_cuts.
+        size (int): Maximum span length.
+        overlap (int): Overlap between consecutive spans.
+
+    Yields:
+        Tuple[int, int]: Half-open (start, end) offsets into text.
+    """
+    start = 0
+    prev_end = 0
+    n = len(text)
+    ci = 0
+    while n - start > size:
+        limit = start + size
+        best = -1
+        best_priority = None
+        while ci < len(cuts) and cuts[ci][0] <= limit:
+            pos, priority = cuts[ci]
+            # Ends must pass the previous end so every chunk adds new
+            # content (cuts inside the overlap only ever start chunks).
+            # Positions ascend, so <= keeps the furthest cut at the best
+            # priority seen in the window.
+            if pos > prev_end and (best_priority is None or priority <= best_priority):
+                best = pos
+                best_priority = priority
+            ci += 1
+        if best < 0:
+            best = limit  # No separator in the window: hard cut
+        yield (start, best)
+        prev_end = best
+        new_start = max(best - overlap, start + 1)
+        while ci > 0 and cuts[ci - 1][0] > new_start:  # Reuse cuts inside the overlap
+            ci -= 1
+        # Snap the overlap start forward to the next cut (overlap is a
+        # budget, not a promise) so the chunk doesn't begin mid-word.
+        if overlap and ci < len(cuts) and new_start < cuts[ci][0] < best:
+            new_start = cuts[ci][0]
+        start = new_start
+    yield (start, n)
+
+class FastRecursiveSplitter(RecursiveCharacterTextSplitter):
+    """
+    RecursiveCharacterTextSplitter variant that finds all separator
+    positions in one Aho-Corasick pass instead of re-scanning the text once
+    per separator, then packs chunks greedily at the found cut points.
+    Falls back to the stock recursive behavior when pyahocorasick is not
+    installed or a custom length function is in use.
+    """
+
+    def split_text(self, text: str) -> List[str]:
+        if not text:  # Match the stock splitter: no chunks, not ['']
+            return []
+        if ahocorasick is None or self._length_function is not len:
+            return super().split_text(text)
+        separators = tuple(s for s in self._separators if s)
+        if not separators:
+            return super().split_text(text)
+        size = self._chunk_size
+        overlap = self._chunk_overlap
+        if len(text) <= size:
+            return [text]
+        # One linear DFA scan: cut candidates sit just after each separator.
+        cuts = _separator_cuts(text, separators)
+        return [text[start:end] for start, end in _iter_spans(text, cuts, size, overlap)]
+
+@lru_cache(maxsize=32)
+def _get_recursive_splitter(chunk_size: int, chunk_overlap: int, length_mode: str = "char") -> RecursiveCharacterTextSplitter:
+    """
+    Returns a memoized RecursiveCharacterTextSplitter. Constructing one
+    compiles separator regexes, so caching by config skips that cost when
+    the same settings are used across many calls or documents.
+
+    Parameters:
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+        length_mode (str): "char" to budget by characters, "word" to budget
+            by approximate word count.
+
+    Returns:
+        RecursiveCharacterTextSplitter: The cached splitter instance.
+    """
+    kwargs = {}
+    length_function = _length_function(length_mode)
+    if length_function is not None:
+        kwargs["length_function"] = length_function
+    return FastRecursiveSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        is_separator_regex=False,
+        **kwargs
+    )
+
+@lru_cache(maxsize=32)
+def _get_char_splitter(separator: str, chunk_size: int, chunk_overlap: int, length_mode: str = "char") -> CharacterTextSplitter:
+    """
+    Returns a memoized CharacterTextSplitter, keyed by separator and chunk
+    config, for the same reason as _get_recursive_splitter.
+
+    Parameters:
+        separator (str): Character or string to separate chunks.
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+        length_mode (str): "char" to budget by characters, "word" to budget
+            by approximate word count.
+
+    Returns:
+        CharacterTextSplitter: The cached splitter instance.
+    """
+    kwargs = {}
+    length_function = _length_function(length_mode)
+    if length_function is not None:
+        kwargs["length_function"] = length_function
+    return CharacterTextSplitter(
+        separator=separator,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        is_separator_regex=False,
+        **kwargs
+    )
+
+def _fast_char_split(text: str, separator: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """
+    Split on a single-character separator with str.split (a C-level memchr
+    scan) and greedy-merge the parts back up to chunk_size, instead of
+    langchain's Python-level scan-and-merge. Trailing parts within the
+    overlap budget seed the next chunk.
+
+    Parameters:
+        text (str): The text to split.
+        separator (str): The single-character separator.
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+
+    Returns:
+        List[str]: The merged chunks, in order.
+    """
+    if not text:  # Match the stock splitter: no chunks, not ['']
+        return []
+    parts = text.split(separator)
+    sep_len = len(separator)
+    chunks = []
+    current = []
+    current_len = 0
+    for part in parts:
+        added = len(part) + (sep_len if current else 0)
+        if current and current_len + added > chunk_size:
+            chunks.append(separator.join(current))
+            # Seed the next chunk with trailing parts inside the overlap budget
+            overlap = []
+            overlap_len = 0
+            for previous in reversed(current):
+                extra = len(previous) + (sep_len if overlap else 0)
+                if overlap_len + extra > chunk_overlap:
+                    break
+                overlap.insert(0, previous)
+                overlap_len += extra
+            current = overlap
+            current_len = overlap_len
+            added = len(part) + (sep_len if current else 0)
+            # Shrink the carried overlap until the incoming part fits, as
+            # langchain's _merge_splits does; only a part that is itself
+            # oversized may still exceed the budget, emitted on its own.
+            while current and current_len + added > chunk_size:
+                dropped = current.pop(0)
+                current_len -= len(dropped) + (sep_len if current else 0)
+                added = len(part) + (sep_len if current else 0)
+        current.append(part)
+        current_len += added
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+def _split_doc_html(doc: Document, chunk_size: int, chunk_overlap: int, headers_to_split_on: List[str]) -> List[LightDoc]:
+    """
+    Split one HTML document into chunked LightDocs. Module-level so it is
+    picklable by ProcessPoolExecutor workers.
+
+    Parameters:
+        doc (Document): The document whose HTML content is split.
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+        headers_to_split_on (List[str]): HTML tags to use for splitting.
+
+    Returns:
+        List[LightDoc]: Chunked records with added metadata.
+    """
+    # One parse and one query over all tags, in document order — no
+    # per-tag DOM walks.
+    sections = _extract_sections(doc.page_content, tuple(headers_to_split_on))
+    return _split_sections(sections, doc.metadata, chunk_size, chunk_overlap)
+
+def _split_sections(sections: List[Tuple[str, str]], doc_metadata, chunk_size: int, chunk_overlap: int) -> List[LightDoc]:
+    """
+    Chunk already-extracted (tag, text) sections into LightDocs. Split out
+    from _split_doc_html so cached section lists can be re-chunked without
+    re-parsing the HTML.
+
+    Parameters:
+        sections (List[Tuple[str, str]]): (tag name, section text) pairs.
+        doc_metadata: The source document's metadata.
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+
+    Returns:
+        List[LightDoc]: Chunked records with added metadata.
+    """
+    section_splitter = _get_recursive_splitter(chunk_size, chunk_overlap)
+    # Struct-of-arrays accumulation: collect contents and per-chunk metadata
+    # deltas first, then materialize Documents in one pass. ChainMap layers
+    # the delta over the shared base metadata instead of copying the base
+    # dict for every chunk. The base stays a plain dict: this runs in pool
+    # workers whose results are pickled back, and mappingproxy can't pickle.
+    base = doc_metadata
+    page_contents = []
+    metadatas = []
+    for idx, (header, text) in enumerate(sections):
+        if not text:  # Empty sections (e.g. <p></p>) emit no chunk
+            continue
+        # A section that already fits needs no separator search at all.
+        chunks = [text] if len(text) <= chunk_size else section_splitter.split_text(text)
+        for chunk_idx, chunk in enumerate(chunks):
+            page_contents.append(chunk)
+            # (section, chunk) as a plain tuple: no int formatting or string
+            # concatenation per chunk; stringify at serialization if needed.
+            metadatas.append(ChainMap(
+                {"chunkno": (idx + 1, chunk_idx + 1), "header_type": header},
+                base
+            ))
+    return [
+        LightDoc(page_content=content, metadata=metadata)
+        for content, metadata in zip(page_contents, metadatas)
+    ]
+
+def _iter_html_chunks(doc: Document, chunk_size: int, chunk_overlap: int, tags: Tuple[str, ...]):
+    """
+    Fused parse → section → chunk pass over one HTML document: each section
+    is chunked and yielded as soon as the parser emits it, with no
+    intermediate section or chunk lists. With lxml installed, peak memory is
+    one section plus its chunks rather than the whole parsed document.
+
+    Parameters:
+        doc (Document): The document whose HTML content is split.
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+        tags (Tuple[str, ...]): HTML tags to use for splitting.
+
+    Yields:
+        LightDoc: Chunked records with added metadata.
+    """
+    section_splitter = _get_recursive_splitter(chunk_size, chunk_overlap)
+    base = MappingProxyType(doc.metadata)
+    for idx, (header, text) in enumerate(_iter_sections(doc.page_content, tags)):
+        if not text:  # Empty sections (e.g. <p></p>) emit no chunk
+            continue
+        # A section that already fits needs no separator search at all.
+        chunks = [text] if len(text) <= chunk_size else section_splitter.split_text(text)
+        for chunk_idx, chunk in enumerate(chunks):
+            yield LightDoc(
+                page_content=chunk,
+                metadata=ChainMap(
+                    # (section, chunk) as a plain tuple: no int formatting
+                    # per chunk; stringify at serialization if needed.
+                    {"chunkno": (idx + 1, chunk_idx + 1), "header_type": header},
+                    base
+                )
+            )
+
+def _split_doc_recursive(doc: Document, chunk_size: int, chunk_overlap: int, length_mode: str = "char") -> List[LightDoc]:
+    """
+    Split one document with RecursiveCharacterTextSplitter. Module-level so
+    it is picklable by ProcessPoolExecutor workers.
+
+    Parameters:
+        doc (Document): The document to split.
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+
+    Returns:
+        List[LightDoc]: Chunked records with added metadata.
+    """
+    # A non-empty doc that already fits needs no recursive separator search.
+    # (Character lengths only: word budgets can't be compared against len.)
+    if length_mode == "char" and 0 < len(doc.page_content) <= chunk_size:
+        return [LightDoc(page_content=doc.page_content, metadata=ChainMap({"chunkno": 1}, doc.metadata))]
+    text_splitter = _get_recursive_splitter(chunk_size, chunk_overlap, length_mode)
+    splits = text_splitter.split_text(doc.page_content)
+    # _build_documents runs the materialization loop in the compiled core
+    # when available. The shared base stays a plain dict: this runs in pool
+    # workers whose results are pickled back, and mappingproxy can't pickle.
+    return _build_documents(splits, doc.metadata)
+
+def _split_doc_character(doc: Document, chunk_size: int, chunk_overlap: int, separator: str, length_mode: str = "char") -> List[LightDoc]:
+    """
+    Split one document with CharacterTextSplitter. Module-level so it is
+    picklable by ProcessPoolExecutor workers.
+
+    Parameters:
+        doc (Document): The document to split.
+        chunk_size (int): Maximum size of each chunk.
+        chunk_overlap (int): Overlap between consecutive chunks.
+        separator (str): Character or string to separate chunks.
+
+    Returns:
+        List[LightDoc]: Chunked records with added metadata.
+    """
+    # A non-empty doc that already fits needs no separator scan at all.
+    # (Character lengths only: word budgets can't be compared against len.)
+    if length_mode == "char" and 0 < len(doc.page_content) <= chunk_size:
+        return [LightDoc(page_content=doc.page_content, metadata=ChainMap({"chunkno": 1}, doc.metadata))]
+    if length_mode == "char" and len(separator) == 1:
+        # Single-char separators (the "\n" default) take the memchr-backed
+        # fast path; langchain handles multi-char separators.
+        splits = _fast_char_split(doc.page_content, separator, chunk_size, chunk_overlap)
+    else:
+        text_splitter = _get_char_splitter(separator, chunk_size, chunk_overlap, length_mode)
+        splits = text_splitter.split_text(doc.page_content)
+    # _build_documents runs the materialization loop in the compiled core
+    # when available. The shared base stays a plain dict: this runs in pool
+    # workers whose results are pickled back, and mappingproxy can't pickle.
+    return _build_documents(splits, doc.metadata)
+
+class LangchainSplitters:
+    # Below this many documents, process-pool pickling costs more than the
+    # splitting itself, so the map runs serially.
+    PARALLEL_THRESHOLD = 8
+
+    def __init__(self, docs: Iterable[Document]):
+        """
+        Initialize LangchainSplitters with the documents to be processed
+        and split. Any iterable works — a list, a generator, a JSONL
+        reader — so corpora larger than RAM can be streamed through the
+        iter_* methods one document at a time. A one-shot iterator is
+        consumed by the first splitting call (the eager list-returning
+        methods materialize it instead, since their output is corpus-sized
+        anyway).
+
+        Parameters:
+            docs (Iterable[Document]): The Document objects to split.
+        """
+        # Extracted HTML sections keyed by (id(doc), tags), so re-splitting
+        # the same corpus with different chunk settings (e.g. while tuning
+        # chunk_size) skips the parse, which dominates html_splitter CPU.
+        self._section_cache = {}
+        self.docs = docs
+
+    @property
+    def docs(self) -> Iterable[Document]:
+        return self._docs
+
+    @docs.setter
+    def docs(self, docs: Iterable[Document]):
+        # New corpus: cached sections (keyed by object identity) are stale.
+        self._section_cache.clear()
+        self._docs = docs
+
+    def _doc_list(self) -> List[Document]:
+        """
+        Materializes self.docs once for the eager code paths, which need
+        len() and repeated passes. The list replaces the spent iterator so
+        later calls see the same corpus.
+
+        Returns:
+            List[Document]: The documents as a list.
+        """
+        if not isinstance(self._docs, list):
+            self._docs = list(self._docs)
+        return self._docs
+
+    def _cached_sections(self, doc: Document, tags: Tuple[str, ...]) -> List[Tuple[str, str]]:
+        """
+        Returns the (tag, text) sections for a document, parsing at most
+        once per (document, tags) pair for the lifetime of self.docs.
+
+        Parameters:
+            doc (Document): The document whose HTML content is sectioned.
+            tags (Tuple[str, ...]): The tag names to extract.
+
+        Returns:
+            List[Tuple[str, str]]: (tag name, section text) pairs.
+        """
+        key = (id(doc), tags)
+        sections = self._section_cache.get(key)
+        if sections is None:
+            sections = _extract_sections(doc.page_content, tags)
+            self._section_cache[key] = sections
+        return sections
+
+    def _map_docs(self, split_one, max_workers: int = None, docs: List[Document] = None) -> List[List[LightDoc]]:
+        """
+        Map a per-document split function over the documents, fanning out to
+        a process pool for large corpora. Splitting is pure CPU and
+        independent per document, so it scales with cores once the corpus is
+        big enough to amortize pickling.
+
+        Parameters:
+            split_one (callable): Picklable function mapping one Document to
+                a list of chunked LightDocs.
+            max_workers (int): Worker processes to use (default: all cores).
+            docs (List[Document]): Documents to split (default: self.docs).
+
+        Returns:
+            List[List[LightDoc]]: Per-document chunk lists, in input order.
+        """
+        if docs is None:
+            docs = self._doc_list()
+        elif not isinstance(docs, list):
+            docs = list(docs)
+        if len(docs) < self.PARALLEL_THRESHOLD:
+            return list(map(split_one, docs))
+        workers = max_workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(docs) // (4 * workers))
+            results = list(executor.map(split_one, docs, chunksize=chunksize))
+        return results
+
+    def _iter_docs(self, split_one):
+        """
+        Lazily map a per-document split function over self.docs, yielding
+        chunks as they are produced. Peak memory stays at one document's
+        chunks instead of three full materialized lists.
+
+        Parameters:
+            split_one (callable): Function mapping one Document to a list of
+                chunked LightDocs.
+
+        Yields:
+            Document: Chunked Documents in input order.
+        """
+        for doc in self.docs:
+            yield from _to_langchain(split_one(doc))
+
+    def iter_html(self, chunk_size: int = 100, chunk_overlap: int = 20, headers_to_split_on: List[str] = ["h1", "h2", "h3", "p"]):
+        """
+        Streaming variant of html_splitter: yields chunked Documents lazily
+        so downstream ingestion can run with bounded memory.
+
+        Parameters:
+            chunk_size (int): Maximum size of each chunk.
+            chunk_overlap (int): Overlap between consecutive chunks.
+            headers_to_split_on (List[str]): HTML tags to use for splitting.
+
+        Yields:
+            Document: Chunked Documents with added metadata.
+        """
+        tags = tuple(headers_to_split_on)
+        # Always the fused streaming pass — no _section_cache replay, so
+        # the output never depends on whether html_splitter ran first.
+        for doc in self.docs:
+            for light in _iter_html_chunks(doc, chunk_size, chunk_overlap, tags):
+                yield light.to_langchain()
+
+    def iter_recursive(self, chunk_size: int = 900, chunk_overlap: int = 100, length_mode: str = "char"):
+        """
+        Streaming variant of recursive_text_splitter: yields chunked
+        Documents lazily so downstream ingestion can run with bounded memory.
+
+        Parameters:
+            chunk_size (int): Maximum size of each chunk.
+            chunk_overlap (int): Overlap between consecutive chunks.
+
+        Yields:
+            Document: Chunked Documents with added metadata.
+        """
+        split_one = partial(
+            _split_doc_recursive,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_mode=length_mode
+        )
+        return self._iter_docs(split_one)
+
+    def iter_character(self, chunk_size: int = 1000, chunk_overlap: int = 200, separator: str = "\n", length_mode: str = "char"):
+        """
+        Streaming variant of character_text_splitter: yields chunked
+        Documents lazily so downstream ingestion can run with bounded memory.
+
+        Parameters:
+            chunk_size (int): Maximum size of each chunk.
+            chunk_overlap (int): Overlap between consecutive chunks.
+            separator (str): Character or string to separate chunks.
+
+        Yields:
+            Document: Chunked Documents with added metadata.
+        """
+        split_one = partial(
+            _split_doc_character,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            separator=separator,
+            length_mode=length_mode
+        )
+        return self._iter_docs(split_one)
+
+    def iter_chunk_spans(self, chunk_size: int = 900, chunk_overlap: int = 100, separators: Tuple[str, ...] = ("\n\n", "\n", " ")):
+        """
+        Zero-copy variant of iter_recursive: yields LightDoc records whose
+        page_content is the source document's full text (shared by
+        reference, never sliced) and whose metadata carries a half-open
+        (start, end) "span". Consumers slice `doc.page_content[s:e]` at use
+        time, so peak memory stays at one copy of each document instead of
+        document plus all its chunk substrings.
+
+        Parameters:
+            chunk_size (int): Maximum size of each span.
+            chunk_overlap (int): Overlap between consecutive spans.
+            separators (Tuple[str, ...]): Separators to cut at, in priority
+                order.
+
+        Yields:
+            LightDoc: One record per chunk with "span" and "chunkno" metadata.
+        """
+        for doc in self.docs:
+            text = doc.page_content
+            if not text:  # Empty docs emit no span
+                continue
+            base = MappingProxyType(doc.metadata)
+            if len(text) <= chunk_size:
+                yield LightDoc(page_content=text, metadata=ChainMap({"chunkno": 1, "span": (0, len(text))}, base))
+                continue
+            cuts = _separator_cuts(text, separators)
+            for i, span in enumerate(_iter_spans(text, cuts, chunk_size, chunk_overlap)):
+                yield LightDoc(page_content=text, metadata=ChainMap({"chunkno": i + 1, "span": span}, base))
+
+    def iter_jsonl(self, chunks: Iterable):
+        """
+        Serializes chunked documents to JSONL bytes for the ingestion
+        output path. Each chunk becomes one {"page_content", "metadata"}
+        line built from the attributes directly — no pydantic .dict()/
+        .json() pass — and encoded with orjson when installed (stdlib json
+        otherwise). Accepts the output of any splitting method, eager or
+        streaming, so chunks can go straight to disk:
+
+            with open(path, "wb") as out:
+                out.writelines(splitters.iter_jsonl(splitters.iter_recursive()))
+
+        Parameters:
+            chunks (Iterable): Document or LightDoc chunks to serialize.
+
+        Yields:
+            bytes: One newline-terminated JSON line per chunk.
+        """
+        for chunk in chunks:
+            # dict() flattens the ChainMap layers into one plain mapping
+            record = {"page_content": chunk.page_content, "metadata": dict(chunk.metadata)}
+            if orjson is not None:
+                yield orjson.dumps(record) + b"\n"
+            else:
+                yield json.dumps(record).encode() + b"\n"
+
+    def html_splitter(self, chunk_size: int = 100, chunk_overlap: int = 20, headers_to_split_on: List[str] = ["h1", "h2", "h3", "p"], max_workers: int = None) -> List[Document]:
+        """
+        Splits HTML content in the documents based on specified HTML headers
+        and paragraphs, in parallel across documents for large corpora.
+
+        Parameters:
+            chunk_size (int): Maximum size of each chunk.
+            chunk_overlap (int): Overlap between consecutive chunks.
+            headers_to_split_on (List[str]): HTML tags to use for splitting (e.g., "h1", "h2").
+            max_workers (int): Worker processes to use (default: all cores).
+
+        Returns:
+            List[Document]: A list of chunked Document objects with added metadata.
+        """
+        try:
+            tags = tuple(headers_to_split_on)
+            docs = self._doc_list()
+            if len(docs) < self.PARALLEL_THRESHOLD:
+                # Serial path: reuse (and populate) the per-document section
+                # cache so repeated calls only pay for re-chunking.
+                results = [
+                    _split_sections(self._cached_sections(doc, tags), doc.metadata, chunk_size, chunk_overlap)
+                    for doc in docs
+                ]
+            else:
+                # Pool path: each worker parses in its own process, so the
+                # parent-side cache is neither consulted nor populated.
+                split_one = partial(
+                    _split_doc_html,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                    headers_to_split_on=headers_to_split_on
+                )
+                results = self._map_docs(split_one, max_workers=max_workers)
+            return _to_langchain(_flatten(results))
+        except Exception as e:
+            print(f"Error in html_splitter: {str(e)}")
+            return []
+
+    def recursive_text_splitter(self, chunk_size: int = 900, chunk_overlap: int = 100, max_workers: int = None, length_mode: str = "char") -> List[Document]:
+        """
+        Splits text in each document recursively based on character length,
+        in parallel across documents for large corpora.
+
+        Parameters:
+            chunk_size (int): Maximum size of each chunk.
+            chunk_overlap (int): Overlap between consecutive chunks.
+            max_workers (int): Worker processes to use (default: all cores).
+
+        Returns:
+            List[Document]: A list of chunked Document objects with added metadata.
+        """
+        try:
+            split_one = partial(
+                _split_doc_recursive,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_mode=length_mode
+            )
+            # Small docs fit in a single chunk: emit them directly instead of
+            # paying a split_text call (and pickling to a pool worker) each.
+            # Empty docs emit nothing, matching the stock splitter.
+            docs = self._doc_list()
+            results = [None] * len(docs)
+            pending = []
+            for i, doc in enumerate(docs):
+                if not doc.page_content:
+                    results[i] = []
+                elif len(doc.page_content) <= chunk_size:
+                    results[i] = [LightDoc(page_content=doc.page_content, metadata=ChainMap({"chunkno": 1}, doc.metadata))]
+                else:
+                    pending.append(i)
+            if pending:
+                split_results = self._map_docs(split_one, max_workers=max_workers, docs=[docs[i] for i in pending])
+                for i, chunks in zip(pending, split_results):
+                    results[i] = chunks
+            return _to_langchain(_flatten(results))
+        except Exception as e:
+            print(f"Error in recursive_text_splitter: {str(e)}")
+            return []
+
+    def character_text_splitter(self, chunk_size: int = 1000, chunk_overlap: int = 200, separator: str = "\n", max_workers: int = None, length_mode: str = "char") -> List[Document]:
+        """
+        Splits text in each document based on a character separator, in
+        parallel across documents for large corpora.
+
+        Parameters:
+            chunk_size (int): Maximum size of each chunk.
+            chunk_overlap (int): Overlap between consecutive chunks.
+            separator (str): Character or string to separate chunks.
+            max_workers (int): Worker processes to use (default: all cores).
+
+        Returns:
+            List[Document]: A list of chunked Document objects with added metadata.
+        """
+        try:
+            split_one = partial(
+                _split_doc_character,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                separator=separator,
+                length_mode=length_mode
+            )
+            return _to_langchain(_flatten(self._map_docs(split_one, max_workers=max_workers)))
+        except Exception as e:
+            print(f"Error in character_text_splitter: {str(e)}")
+            return []
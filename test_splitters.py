@@ -0,0 +1,32 @@
+"""Regression tests for splitters.py."""
+import pickle
+
+import pytest
+
+pytest.importorskip("langchain_text_splitters")
+pytest.importorskip("langchain")
+
+from langchain.schema import Document
+
+import splitters
+from splitters import LangchainSplitters
+
+
+def test_recursive_splitter_pool_path_returns_chunks():
+    # Enough documents to cross PARALLEL_THRESHOLD, so splitting round-trips
+    # through ProcessPoolExecutor and every chunk must pickle back intact.
+    docs = [
+        Document(page_content=("word " * 400).strip(), metadata={"source": f"doc{i}"})
+        for i in range(LangchainSplitters.PARALLEL_THRESHOLD + 2)
+    ]
+    chunks = LangchainSplitters(docs).recursive_text_splitter(chunk_size=200, chunk_overlap=20)
+    assert chunks, "pool path returned no chunks"
+    assert all(chunk.page_content for chunk in chunks)
+    assert {chunk.metadata["source"] for chunk in chunks} == {doc.metadata["source"] for doc in docs}
+
+
+def test_worker_output_is_picklable():
+    doc = Document(page_content="alpha beta " * 100, metadata={"source": "doc"})
+    result = splitters._split_doc_recursive(doc, chunk_size=100, chunk_overlap=10)
+    restored = pickle.loads(pickle.dumps(result))
+    assert [chunk.page_content for chunk in restored] == [chunk.page_content for chunk in result]